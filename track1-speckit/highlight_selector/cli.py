@@ -18,7 +18,7 @@ from highlight_selector.models import GameEvent, Highlight, UserPreference
 from highlight_selector.selector import select_highlights
 
 
-def parse_input(raw: str) -> tuple[list[GameEvent], UserPreference]:
+def parse_input(raw: str | bytes) -> tuple[list[GameEvent], UserPreference]:
     """Parse JSON input string into events and preferences.
 
     Accepted input formats:
@@ -27,7 +27,7 @@ def parse_input(raw: str) -> tuple[list[GameEvent], UserPreference]:
     3. With game wrapper: {"game": {...}, "events": [...], "user_preferences": {...}}
 
     Args:
-        raw: JSON string from stdin.
+        raw: JSON document from stdin, as text or undecoded UTF-8 bytes.
 
     Returns:
         Tuple of (events list, user preference).
@@ -37,7 +37,7 @@ def parse_input(raw: str) -> tuple[list[GameEvent], UserPreference]:
     """
     try:
         data = json.loads(raw)
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         raise ValueError(f"Invalid JSON input: {e}") from e
 
     if not isinstance(data, dict):
@@ -95,7 +95,9 @@ def format_output(
 def main() -> None:
     """Main CLI entry point. Reads from stdin, writes to stdout."""
     try:
-        raw_input = sys.stdin.read()
+        # Read raw bytes; json.loads decodes UTF-8 itself, skipping the
+        # text-layer decode of the whole payload.
+        raw_input = sys.stdin.buffer.read()
         if not raw_input.strip():
             print(
                 json.dumps({"error": "No input provided. Pipe JSON to stdin."}),
@@ -106,7 +108,12 @@ def main() -> None:
         events, prefs = parse_input(raw_input)
         highlights = select_highlights(events, prefs)
         output = format_output(highlights, len(events), prefs)
-        print(json.dumps(output, indent=2))
+        # Pretty-print for a terminal; emit compact JSON when piped, where
+        # json's pure-Python indent path would dominate serialization.
+        if sys.stdout.isatty():
+            print(json.dumps(output, indent=2))
+        else:
+            print(json.dumps(output, separators=(",", ":")))
 
     except ValueError as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
@@ -7,6 +7,7 @@ serialization via to_dict()/from_dict() methods.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -18,8 +19,21 @@ IMPORTANCE_RANK: dict[str, int] = {
     "low": 1,
 }
 
+# Known importance levels, for membership checks
+IMPORTANCE_KEYS: frozenset[str] = frozenset(IMPORTANCE_RANK)
 
-@dataclass
+
+def _intern(value: Any) -> Any:
+    """Intern a string so repeated names and tags share one object.
+
+    Player, team, importance, and tag values recur across events and are
+    compared against preferences, where interned strings match by identity.
+    Non-string values are returned unchanged.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True)
 class GameEvent:
     """Represents a single event in a game.
 
@@ -45,6 +59,12 @@ class GameEvent:
     importance: str
     tags: list[str] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        """Intern the fields compared during scoring, however the event was built."""
+        self.importance = _intern(self.importance)
+        self.player = _intern(self.player)
+        self.team = _intern(self.team)
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize to a dictionary."""
         return {
@@ -68,22 +88,22 @@ class GameEvent:
         - Missing tags defaults to empty list.
         """
         importance = data.get("importance", "low")
-        if importance not in IMPORTANCE_RANK:
+        if importance not in IMPORTANCE_KEYS:
             importance = "low"
         return cls(
             id=data["id"],
-            type=data["type"],
+            type=_intern(data["type"]),
             timestamp=data.get("timestamp", ""),
             quarter=data.get("quarter", 1),
             player=data.get("player", "Unknown"),
             team=data.get("team", "Unknown"),
             description=data.get("description", ""),
             importance=importance,
-            tags=data.get("tags", []),
+            tags=[_intern(tag) for tag in data.get("tags", [])],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class UserPreference:
     """User's personalization settings.
 
@@ -95,6 +115,11 @@ class UserPreference:
     favorite_player: str | None = None
     favorite_team: str | None = None
 
+    def __post_init__(self) -> None:
+        """Intern favorites so matches against interned event fields hit by identity."""
+        self.favorite_player = _intern(self.favorite_player)
+        self.favorite_team = _intern(self.favorite_team)
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize to a dictionary."""
         return {
@@ -116,7 +141,7 @@ class UserPreference:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreBreakdown:
     """Detailed scoring components for explainability.
 
@@ -166,7 +191,7 @@ class ScoreBreakdown:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Highlight:
     """A selected highlight with explanation.
 
@@ -6,6 +6,8 @@ and orchestrate the full highlight selection pipeline.
 
 from __future__ import annotations
 
+import heapq
+
 from highlight_selector.models import (
     GameEvent,
     Highlight,
@@ -23,6 +25,9 @@ BASE_SCORES: dict[str, int] = {
     "low": 25,
 }
 
+# FR-012: unknown importance levels score as "low"
+_DEFAULT_BASE_SCORE: int = BASE_SCORES["low"]
+
 CONTEXT_BOOST_MAP: dict[str, int] = {
     "clutch": 20,
     "highlight_reel": 15,
@@ -38,6 +43,19 @@ TEAM_BOOST: int = 15
 MIN_HIGHLIGHTS: int = 5
 MAX_HIGHLIGHTS: int = 8
 
+# Ranking entry: (-score, -quarter, -importance rank, id, input index, (event, breakdown))
+_RankEntry = tuple[int, int, int, str, int, tuple[GameEvent, ScoreBreakdown]]
+
+# --- Explanation templates ---
+
+# Sentence 1 by importance level; unknown levels use the "low" wording
+IMPORTANCE_TEMPLATES: dict[str, str] = {
+    "critical": "This critical {type} by {player} was a defining moment of the game.",
+    "high": "A high-impact {type} by {player} that made a significant difference.",
+    "medium": "A notable {type} by {player} that contributed to the game's story.",
+    "low": "This {type} by {player} added to the overall flow of the game.",
+}
+
 
 def score_event(
     event: GameEvent,
@@ -53,8 +71,7 @@ def score_event(
         A ScoreBreakdown with all scoring components.
     """
     # Base score from importance (FR-012: unknown defaults to "low")
-    importance = event.importance if event.importance in BASE_SCORES else "low"
-    base_score = BASE_SCORES[importance]
+    base_score = BASE_SCORES.get(event.importance, _DEFAULT_BASE_SCORE)
 
     # Player preference boost (+30 per plan)
     player_boost = 0
@@ -66,29 +83,32 @@ def score_event(
     if prefs and prefs.favorite_team and event.team == prefs.favorite_team:
         team_boost = TEAM_BOOST
 
+    # Every component is known here, so the total is accumulated as we go
+    # rather than re-summed by ScoreBreakdown (the base score is never zero).
+    total_score = base_score + player_boost + team_boost
+
     # Context boosts from tags
     context_boosts: dict[str, int] = {}
     for tag in event.tags:
-        if tag in CONTEXT_BOOST_MAP:
-            context_boosts[tag] = CONTEXT_BOOST_MAP[tag]
+        boost = CONTEXT_BOOST_MAP.get(tag)
+        if boost is not None and tag not in context_boosts:
+            context_boosts[tag] = boost
+            total_score += boost
 
     # Fourth quarter bonus
     if event.quarter == 4:
         context_boosts["fourth_quarter"] = FOURTH_QUARTER_BOOST
+        total_score += FOURTH_QUARTER_BOOST
 
     return ScoreBreakdown(
         base_score=base_score,
         player_boost=player_boost,
         team_boost=team_boost,
         context_boosts=context_boosts,
+        total_score=total_score,
     )
 
 
-def _importance_rank(importance: str) -> int:
-    """Return numeric rank for an importance level (higher = more important)."""
-    return IMPORTANCE_RANK.get(importance, 0)
-
-
 def rank_and_filter(
     scored_events: list[tuple[GameEvent, ScoreBreakdown]],
     min_count: int = MIN_HIGHLIGHTS,
@@ -98,7 +118,7 @@ def rank_and_filter(
 
     Selection rules (per spec):
     1. Force-include all critical events (FR-006).
-    2. Sort remaining by score descending.
+    2. Select the top remaining events by score descending.
     3. Apply three-level tie-breaking: quarter desc, importance desc, id asc (FR-013).
     4. Select top events within min_count-max_count range (FR-005).
 
@@ -113,35 +133,35 @@ def rank_and_filter(
     if not scored_events:
         return []
 
-    # Deterministic sort key (FR-009, FR-013, SC-004)
-    def sort_key(item: tuple[GameEvent, ScoreBreakdown]) -> tuple[int, int, int, str]:
+    # Deterministic sort key (FR-009, FR-013, SC-004), built once per event:
+    # descending score, quarter and importance, then ascending ID. The input
+    # position breaks any remaining tie so the pair itself is never compared.
+    # Critical events are force-included (FR-006), so partition in the same pass.
+    critical: list[_RankEntry] = []
+    non_critical: list[_RankEntry] = []
+    for index, item in enumerate(scored_events):
         event, breakdown = item
-        return (
-            -breakdown.total_score,  # Descending score
-            -event.quarter,  # Descending quarter
-            -_importance_rank(event.importance),  # Descending importance
-            event.id,  # Ascending ID (deterministic)
+        entry = (
+            -breakdown.total_score,
+            -event.quarter,
+            -IMPORTANCE_RANK.get(event.importance, 0),
+            event.id,
+            index,
+            item,
         )
+        if event.importance == "critical":
+            critical.append(entry)
+        else:
+            non_critical.append(entry)
 
-    sorted_events = sorted(scored_events, key=sort_key)
+    # Only the top max_count events can survive, so select them with a
+    # bounded heap instead of sorting the whole list. If critical events
+    # exceed max_count, this keeps the top-scored critical events.
+    critical = heapq.nsmallest(max_count, critical)
+    non_critical = heapq.nsmallest(max_count - len(critical), non_critical)
 
-    # Force-include critical events (FR-006)
-    critical = [item for item in sorted_events if item[0].importance == "critical"]
-    non_critical = [item for item in sorted_events if item[0].importance != "critical"]
-
-    # If critical events exceed max_count, take the top-scored critical events
-    if len(critical) > max_count:
-        critical = critical[:max_count]
-
-    # Build result: critical events first, then fill from non-critical
-    result = list(critical)
-    for item in non_critical:
-        if len(result) >= max_count:
-            break
-        result.append(item)
-
-    # Re-sort the final result by the same key for consistent output ordering
-    result.sort(key=sort_key)
+    # Both selections are already in key order; merge them for the output
+    result = [entry[5] for entry in heapq.merge(critical, non_critical)]
 
     return result
 
@@ -162,41 +182,26 @@ def generate_explanation(
     Returns:
         A 1-2 sentence explanation string referencing scoring factors.
     """
-    parts: list[str] = []
-
     # --- Sentence 1: Importance + event context ---
-    event_type_display = event.type.replace("_", " ")
-
-    if event.importance == "critical":
-        parts.append(
-            f"This critical {event_type_display} by {event.player} was a defining moment of the game."
-        )
-    elif event.importance == "high":
-        parts.append(
-            f"A high-impact {event_type_display} by {event.player} that made a significant difference."
-        )
-    elif event.importance == "medium":
-        parts.append(
-            f"A notable {event_type_display} by {event.player} that contributed to the game's story."
-        )
-    else:
-        parts.append(
-            f"This {event_type_display} by {event.player} added to the overall flow of the game."
-        )
+    template = IMPORTANCE_TEMPLATES.get(event.importance, IMPORTANCE_TEMPLATES["low"])
+    sentence = template.format(type=event.type.replace("_", " "), player=event.player)
 
     # --- Sentence 2: Contextual and personalization details ---
     details: list[str] = []
 
-    # Contextual tags
-    if "game_winner" in event.tags:
+    # Contextual tags (each tag list is scanned once per tag of interest)
+    tags = event.tags
+    is_game_winner = "game_winner" in tags
+    if is_game_winner:
         details.append("sealed the victory")
-    if "clutch" in event.tags and event.quarter == 4:
-        details.append("in a clutch fourth-quarter moment")
-    elif "clutch" in event.tags:
-        details.append("in a clutch moment")
-    if "buzzer_beater" in event.tags:
+    if "clutch" in tags:
+        if event.quarter == 4:
+            details.append("in a clutch fourth-quarter moment")
+        else:
+            details.append("in a clutch moment")
+    if "buzzer_beater" in tags:
         details.append("right at the buzzer")
-    if "highlight_reel" in event.tags and "game_winner" not in event.tags:
+    if not is_game_winner and "highlight_reel" in tags:
         details.append("a highlight-reel play")
 
     # Player preference context
@@ -207,12 +212,12 @@ def generate_explanation(
     if breakdown.team_boost > 0:
         details.append(f"by your favorite team, the {event.team}")
 
-    if details:
-        detail_text = ", ".join(details)
-        # Capitalize first letter and add period
-        parts.append(detail_text[0].upper() + detail_text[1:] + ".")
+    if not details:
+        return sentence
 
-    return " ".join(parts)
+    detail_text = ", ".join(details)
+    # Capitalize first letter and add period
+    return f"{sentence} {detail_text[0].upper()}{detail_text[1:]}."
 
 
 def select_highlights(
@@ -43,8 +43,7 @@ def main() -> None:
         print(f"Error: File not found: {data_path}")
         return
 
-    with open(data_path) as f:
-        raw = json.load(f)
+    raw = json.loads(data_path.read_bytes())
 
     events = [GameEvent.from_dict(e) for e in raw["events"]]
     prefs = UserPreference(
@@ -52,9 +51,12 @@ def main() -> None:
         favorite_team=args.team,
     )
 
-    # Validate preferred player/team exists in events
-    all_players = {e.player for e in events}
-    all_teams = {e.team for e in events}
+    # Validate preferred player/team exists in events (one pass over events)
+    all_players: set[str] = set()
+    all_teams: set[str] = set()
+    for e in events:
+        all_players.add(e.player)
+        all_teams.add(e.team)
     has_error = False
 
     if prefs.favorite_player and prefs.favorite_player not in all_players:
@@ -75,10 +77,12 @@ def main() -> None:
 
     # Filter to only the specified player/team if --only is set
     if args.only:
+        wanted_player = args.player
+        wanted_team = args.team
         highlights = [
             h for h in highlights
-            if (args.player and h.event.player == args.player)
-            or (args.team and h.event.team == args.team)
+            if (wanted_player and h.event.player == wanted_player)
+            or (wanted_team and h.event.team == wanted_team)
         ]
         # Re-number ranks
         for i, h in enumerate(highlights, 1):
@@ -8,25 +8,38 @@ from typing import Any
 
 import pytest
 
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Pin serial-marked tests to one xdist group.
+
+    Under ``pytest -n auto --dist loadgroup`` all grouped tests run on the same
+    worker, one after another, so timing benchmarks don't compete for cores.
+    The group marker is inert when xdist is not in use.
+    """
+    for item in items:
+        if item.get_closest_marker("serial"):
+            item.add_marker(pytest.mark.xdist_group("serial"))
+
+
 SAMPLE_DATA_PATH = (
-    Path(__file__).resolve().parent.parent / "shared" / "sample_data.json"
+    Path(__file__).resolve().parent.parent.parent / "shared" / "sample_data.json"
 )
 
 
-@pytest.fixture
+# Sample data is read-only in every test, so it is parsed once per session.
+@pytest.fixture(scope="session")
 def sample_data() -> dict[str, Any]:
     """Load the full sample data from shared/sample_data.json."""
-    with open(SAMPLE_DATA_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return json.loads(SAMPLE_DATA_PATH.read_bytes())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_events(sample_data: dict[str, Any]) -> list[dict[str, Any]]:
     """Return the raw events list from sample data."""
     return sample_data["events"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_game_events(sample_events: list[dict[str, Any]]) -> list[Any]:
     """Return GameEvent objects from sample data."""
     from highlight_selector.models import GameEvent
@@ -34,6 +47,88 @@ def sample_game_events(sample_events: list[dict[str, Any]]) -> list[Any]:
     return [GameEvent.from_dict(e) for e in sample_events]
 
 
+@pytest.fixture(scope="session")
+def highlight_test_events() -> list[Any]:
+    """Return 10 synthetic events spanning every importance level."""
+    from highlight_selector.models import GameEvent
+
+    importances = [
+        "critical",
+        "high",
+        "high",
+        "high",
+        "medium",
+        "medium",
+        "medium",
+        "low",
+        "low",
+        "low",
+    ]
+    return [
+        GameEvent(
+            id=f"evt-{i:03d}",
+            type="dunk",
+            timestamp=f"Q{(i % 4) + 1} {i:02d}:00",
+            quarter=(i % 4) + 1,
+            player=f"Player {chr(65 + i % 3)}",
+            team="Team A" if i % 2 == 0 else "Team B",
+            description=f"Event {i}",
+            importance=importance,
+            tags=["clutch"] if importance == "critical" else [],
+        )
+        for i, importance in enumerate(importances)
+    ]
+
+
+@pytest.fixture(scope="session")
+def default_highlights(highlight_test_events: list[Any]) -> list[Any]:
+    """Return highlights selected from highlight_test_events with no preference."""
+    from highlight_selector.selector import select_highlights
+
+    return select_highlights(highlight_test_events)
+
+
+@pytest.fixture(
+    scope="session",
+    params=[None, ("Player A", "Team A")],
+    ids=["no_preference", "player_and_team"],
+)
+def any_highlights(
+    request: pytest.FixtureRequest, highlight_test_events: list[Any]
+) -> list[Any]:
+    """Return highlights from highlight_test_events, without and with preferences."""
+    from highlight_selector.models import UserPreference
+    from highlight_selector.selector import select_highlights
+
+    prefs = None
+    if request.param is not None:
+        player, team = request.param
+        prefs = UserPreference(favorite_player=player, favorite_team=team)
+    return select_highlights(highlight_test_events, prefs)
+
+
+@pytest.fixture(scope="session")
+def large_event_set() -> list[Any]:
+    """Return 1000 synthetic events for scaling benchmarks (SC-005)."""
+    from highlight_selector.models import GameEvent
+
+    importances = ("critical", "high", "medium", "low")
+    return [
+        GameEvent(
+            id=f"evt-{i:04d}",
+            type="dunk",
+            timestamp=f"Q{(i % 4) + 1} {i % 12:02d}:00",
+            quarter=(i % 4) + 1,
+            player=f"Player {i % 20}",
+            team=f"Team {i % 4}",
+            description=f"Event {i}",
+            importance=importances[i % 4],
+            tags=["clutch"] if i % 10 == 0 else [],
+        )
+        for i in range(1000)
+    ]
+
+
 @pytest.fixture
 def no_preference() -> Any:
     """Return a UserPreference with no preferences set."""
@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 import re
+from typing import Any
 
 import pytest
 
-from highlight_selector.models import GameEvent, UserPreference, ScoreBreakdown
-from highlight_selector.selector import (
-    generate_explanation,
-    score_event,
-    select_highlights,
+from highlight_selector.models import (
+    GameEvent,
+    Highlight,
+    UserPreference,
+    ScoreBreakdown,
 )
+from highlight_selector.selector import generate_explanation, score_event
 
 
 def _make_event(
@@ -35,44 +37,13 @@ def _make_event(
     )
 
 
-def _make_events_for_highlights(count: int = 10) -> list[GameEvent]:
-    importances = [
-        "critical",
-        "high",
-        "high",
-        "high",
-        "medium",
-        "medium",
-        "medium",
-        "low",
-        "low",
-        "low",
-    ]
-    events = []
-    for i in range(min(count, len(importances))):
-        events.append(
-            GameEvent(
-                id=f"evt-{i:03d}",
-                type="dunk",
-                timestamp=f"Q{(i % 4) + 1} {i:02d}:00",
-                quarter=(i % 4) + 1,
-                player=f"Player {chr(65 + i % 3)}",
-                team="Team A" if i % 2 == 0 else "Team B",
-                description=f"Event {i}",
-                importance=importances[i],
-                tags=["clutch"] if importances[i] == "critical" else [],
-            )
-        )
-    return events
-
-
 class TestExplanationPresence:
     """T038: SC-002 - 100% of highlights have non-empty explanation."""
 
-    def test_all_highlights_have_explanation(self) -> None:
-        events = _make_events_for_highlights()
-        highlights = select_highlights(events)
-        for h in highlights:
+    def test_all_highlights_have_explanation(
+        self, default_highlights: list[Highlight]
+    ) -> None:
+        for h in default_highlights:
             assert h.explanation, f"Highlight {h.event.id} has empty explanation"
             assert len(h.explanation.strip()) > 0
 
@@ -80,16 +51,18 @@ class TestExplanationPresence:
 class TestExplanationLength:
     """T039: SC-007 - Explanation is 1-2 sentences."""
 
+    # Map every sentence terminator to "." so one str.split finds the breaks
+    _TERMINATORS = str.maketrans("!?", "..")
+
     def _count_sentences(self, text: str) -> int:
-        # Count sentences by splitting on sentence-ending punctuation
-        sentences = re.split(r"[.!?]+", text.strip())
-        # Filter out empty strings from trailing punctuation
-        return len([s for s in sentences if s.strip()])
-
-    def test_explanation_is_1_to_2_sentences(self) -> None:
-        events = _make_events_for_highlights()
-        highlights = select_highlights(events)
-        for h in highlights:
+        # Count the non-blank pieces between sentence-ending punctuation
+        pieces = text.translate(self._TERMINATORS).split(".")
+        return len([piece for piece in pieces if piece.strip()])
+
+    def test_explanation_is_1_to_2_sentences(
+        self, default_highlights: list[Highlight]
+    ) -> None:
+        for h in default_highlights:
             sentence_count = self._count_sentences(h.explanation)
             assert 1 <= sentence_count <= 2, (
                 f"Expected 1-2 sentences for {h.event.id}, got {sentence_count}: "
@@ -111,57 +84,70 @@ class TestExplanationLength:
 class TestScoringFactorReferences:
     """T040: Explanation references scoring factors (importance, context)."""
 
-    def test_critical_references_importance(self) -> None:
-        event = _make_event(importance="critical")
-        breakdown = score_event(event)
-        explanation = generate_explanation(event, breakdown)
-        assert "critical" in explanation.lower()
-
-    def test_high_references_importance(self) -> None:
-        event = _make_event(importance="high")
-        breakdown = score_event(event)
-        explanation = generate_explanation(event, breakdown)
-        assert "high-impact" in explanation.lower()
-
-    def test_game_winner_references_context(self) -> None:
-        event = _make_event(tags=["game_winner"])
-        breakdown = score_event(event)
-        explanation = generate_explanation(event, breakdown)
-        assert "victory" in explanation.lower() or "sealed" in explanation.lower()
-
-    def test_clutch_q4_references_context(self) -> None:
-        event = _make_event(quarter=4, tags=["clutch"])
-        breakdown = score_event(event)
-        explanation = generate_explanation(event, breakdown)
-        assert "clutch" in explanation.lower()
-        assert (
-            "fourth-quarter" in explanation.lower()
-            or "fourth quarter" in explanation.lower()
-        )
-
-    def test_buzzer_beater_references_context(self) -> None:
-        event = _make_event(tags=["buzzer_beater"])
-        breakdown = score_event(event)
-        explanation = generate_explanation(event, breakdown)
-        assert "buzzer" in explanation.lower()
-
-    def test_player_preference_references_player(self) -> None:
-        """T049: Player preference mentioned in explanation."""
-        event = _make_event(player="LeBron James")
-        prefs = UserPreference(favorite_player="LeBron James")
-        breakdown = score_event(event, prefs)
-        explanation = generate_explanation(event, breakdown)
-        assert "favorite player" in explanation.lower()
-        assert "lebron james" in explanation.lower()
-
-    def test_team_preference_references_team(self) -> None:
-        """T057: Team preference mentioned in explanation."""
-        event = _make_event(team="Lakers")
-        prefs = UserPreference(favorite_team="Lakers")
+    # Each case lists groups of phrases; the lowercased explanation must
+    # contain at least one phrase from every group.
+    @pytest.mark.parametrize(
+        ("event_kwargs", "prefs", "expected"),
+        [
+            pytest.param(
+                {"importance": "critical"},
+                None,
+                [("critical",)],
+                id="critical_references_importance",
+            ),
+            pytest.param(
+                {"importance": "high"},
+                None,
+                [("high-impact",)],
+                id="high_references_importance",
+            ),
+            pytest.param(
+                {"tags": ["game_winner"]},
+                None,
+                [("victory", "sealed")],
+                id="game_winner_references_context",
+            ),
+            pytest.param(
+                {"quarter": 4, "tags": ["clutch"]},
+                None,
+                [("clutch",), ("fourth-quarter", "fourth quarter")],
+                id="clutch_q4_references_context",
+            ),
+            pytest.param(
+                {"tags": ["buzzer_beater"]},
+                None,
+                [("buzzer",)],
+                id="buzzer_beater_references_context",
+            ),
+            # T049: Player preference mentioned in explanation
+            pytest.param(
+                {"player": "LeBron James"},
+                UserPreference(favorite_player="LeBron James"),
+                [("favorite player",), ("lebron james",)],
+                id="player_preference_references_player",
+            ),
+            # T057: Team preference mentioned in explanation
+            pytest.param(
+                {"team": "Lakers"},
+                UserPreference(favorite_team="Lakers"),
+                [("favorite team",), ("lakers",)],
+                id="team_preference_references_team",
+            ),
+        ],
+    )
+    def test_references_scoring_factor(
+        self,
+        event_kwargs: dict[str, Any],
+        prefs: UserPreference | None,
+        expected: list[tuple[str, ...]],
+    ) -> None:
+        event = _make_event(**event_kwargs)
         breakdown = score_event(event, prefs)
-        explanation = generate_explanation(event, breakdown)
-        assert "favorite team" in explanation.lower()
-        assert "lakers" in explanation.lower()
+        explanation = generate_explanation(event, breakdown).lower()
+        for phrases in expected:
+            assert any(
+                phrase in explanation for phrase in phrases
+            ), f"Expected one of {phrases} in {explanation!r}"
 
 
 class TestNonTechnicalLanguage:
@@ -193,22 +179,43 @@ class TestNonTechnicalLanguage:
         "instance",
     ]
 
-    def test_no_jargon_in_explanations(self) -> None:
-        events = _make_events_for_highlights()
-        highlights = select_highlights(events)
-        for h in highlights:
-            explanation_lower = h.explanation.lower()
-            for jargon in self.JARGON_WORDS:
-                assert jargon not in explanation_lower, (
-                    f"Jargon '{jargon}' found in explanation for {h.event.id}: "
-                    f"'{h.explanation}'"
+    # Jargon is matched as whole words, so "class" does not flag "classic" and
+    # "dict" does not flag "verdict"; plurals ("functions", "classes") are
+    # reduced to their singular before the lookup so they still flag
+    JARGON_SET = frozenset(JARGON_WORDS)
+    WORD_RE = re.compile(r"[a-z_]+")
+
+    def _jargon_in(self, text: str) -> frozenset[str]:
+        found: set[str] = set()
+        for tok in self.WORD_RE.findall(text.lower()):
+            found.update(
+                self.JARGON_SET.intersection(
+                    (tok, tok.removesuffix("s"), tok.removesuffix("es"))
                 )
-
-    def test_no_jargon_with_preferences(self) -> None:
-        events = _make_events_for_highlights()
-        prefs = UserPreference(favorite_player="Player A", favorite_team="Team A")
-        highlights = select_highlights(events, prefs)
-        for h in highlights:
-            explanation_lower = h.explanation.lower()
-            for jargon in self.JARGON_WORDS:
-                assert jargon not in explanation_lower
+            )
+        return frozenset(found)
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Calls two functions.", {"function"}),
+            ("Two classes with dicts.", {"class", "dict"}),
+            (
+                "Passes parameters to methods in modules.",
+                {"parameter", "method", "module"},
+            ),
+            ("A classic verdict.", set()),
+        ],
+    )
+    def test_jargon_check_matches_words_and_plurals(
+        self, text: str, expected: set[str]
+    ) -> None:
+        assert self._jargon_in(text) == expected
+
+    def test_no_jargon_in_explanations(self, any_highlights: list[Highlight]) -> None:
+        for h in any_highlights:
+            overlap = self._jargon_in(h.explanation)
+            assert not overlap, (
+                f"Jargon {sorted(overlap)} found in explanation for {h.event.id}: "
+                f"'{h.explanation}'"
+            )
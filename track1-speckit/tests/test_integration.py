@@ -2,25 +2,27 @@
 
 from __future__ import annotations
 
+import io
 import json
+import sys
 import time
+import timeit
+from itertools import pairwise
 from typing import Any
 
 import pytest
 
 from highlight_selector.models import GameEvent, Highlight, UserPreference
 from highlight_selector.selector import select_highlights
-from highlight_selector.cli import parse_input, format_output
+from highlight_selector.cli import format_output, main, parse_input
 
 
 class TestEndToEndFlow:
     """T063: End-to-end test: JSON input → select_highlights() → JSON output."""
 
-    def test_json_input_to_json_output(
-        self, sample_events: list[dict[str, Any]]
-    ) -> None:
-        # Parse raw event dicts into GameEvent objects
-        events = [GameEvent.from_dict(e) for e in sample_events]
+    def test_json_input_to_json_output(self, sample_game_events: list[Any]) -> None:
+        # Raw event dicts parsed into GameEvent objects (once per session)
+        events = sample_game_events
         prefs = UserPreference(favorite_player="LeBron James")
 
         # Run selection
@@ -32,14 +34,15 @@ class TestEndToEndFlow:
         # Verify output structure
         assert "highlights" in output
         assert "metadata" in output
-        assert output["metadata"]["total_events"] == 15
-        assert 5 <= output["metadata"]["selected_count"] <= 8
-        assert output["metadata"]["preferences"]["favorite_player"] == "LeBron James"
+        metadata = output["metadata"]
+        assert metadata["total_events"] == 15
+        assert 5 <= metadata["selected_count"] <= 8
+        assert metadata["preferences"]["favorite_player"] == "LeBron James"
 
         # Verify highlights are serializable to JSON
-        json_str = json.dumps(output)
+        json_str = json.dumps(output, ensure_ascii=False, separators=(",", ":"))
         parsed_back = json.loads(json_str)
-        assert len(parsed_back["highlights"]) == output["metadata"]["selected_count"]
+        assert len(parsed_back["highlights"]) == metadata["selected_count"]
 
     def test_each_highlight_has_all_fields(self, sample_game_events: list[Any]) -> None:
         highlights = select_highlights(sample_game_events)
@@ -58,14 +61,14 @@ class TestAllUserStoriesTogether:
         highlights = select_highlights(sample_game_events)
         assert 5 <= len(highlights) <= 8
         scores = [h.score for h in highlights]
-        assert scores == sorted(scores, reverse=True)
+        assert all(a >= b for a, b in pairwise(scores))
 
     def test_us2_player_personalization(self, sample_game_events: list[Any]) -> None:
         """US-2: Player preference boosts player events."""
         prefs = UserPreference(favorite_player="LeBron James")
         highlights = select_highlights(sample_game_events, prefs)
 
-        lebron_count = sum(1 for h in highlights if h.event.player == "LeBron James")
+        lebron_count = [h.event.player for h in highlights].count("LeBron James")
         # LeBron has 5 events in sample data, with boost should dominate
         assert lebron_count >= len(highlights) // 2
 
@@ -108,14 +111,14 @@ class TestAllUserStoriesTogether:
         prefs = UserPreference(favorite_player="LeBron James", favorite_team="Lakers")
         highlights = select_highlights(sample_game_events, prefs)
 
+        events = [h.event for h in highlights]
+
         # US-1: 5-8 highlights
         assert 5 <= len(highlights) <= 8
 
         # US-2/3: Boosts applied (LeBron/Lakers should be well represented)
         lebron_or_lakers = sum(
-            1
-            for h in highlights
-            if h.event.player == "LeBron James" or h.event.team == "Lakers"
+            1 for e in events if e.player == "LeBron James" or e.team == "Lakers"
         )
         assert lebron_or_lakers >= len(highlights) // 2
 
@@ -123,12 +126,12 @@ class TestAllUserStoriesTogether:
         assert all(h.explanation for h in highlights)
 
         # US-5: Critical event included regardless
-        critical_events = [h for h in highlights if h.event.importance == "critical"]
-        assert len(critical_events) >= 1
+        assert any(e.importance == "critical" for e in events)
 
         # FR-009: Deterministic
+        ids = [e.id for e in events]
         highlights2 = select_highlights(sample_game_events, prefs)
-        assert [h.event.id for h in highlights] == [h.event.id for h in highlights2]
+        assert [h.event.id for h in highlights2] == ids
 
 
 class TestSampleDataIntegration:
@@ -149,7 +152,7 @@ class TestSampleDataIntegration:
         self, sample_game_events: list[Any], lebron_preference: Any
     ) -> None:
         highlights = select_highlights(sample_game_events, lebron_preference)
-        lebron_count = sum(1 for h in highlights if h.event.player == "LeBron James")
+        lebron_count = [h.event.player for h in highlights].count("LeBron James")
         # LeBron has 5 events, with +30 boost should be well represented
         assert lebron_count >= 3
 
@@ -186,38 +189,50 @@ class TestSampleDataIntegration:
         assert prefs.favorite_player is None
         assert prefs.favorite_team is None
 
+    @pytest.mark.parametrize("is_tty", [True, False], ids=["terminal", "piped"])
+    def test_cli_main_output_format(
+        self,
+        sample_data: dict[str, Any],
+        is_tty: bool,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test CLI output is indented on a terminal and compact when piped."""
+        raw = json.dumps(sample_data).encode()
+        monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(raw)))
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: is_tty)
+
+        main()
+
+        out = capsys.readouterr().out
+        data = json.loads(out)
+        if is_tty:
+            assert out == json.dumps(data, indent=2) + "\n"
+        else:
+            assert out == json.dumps(data, separators=(",", ":")) + "\n"
+
 
+@pytest.mark.serial
 class TestPerformance:
     """T067-T068: Performance benchmarks."""
 
     def test_performance_15_events(self, sample_game_events: list[Any]) -> None:
         """SC-001: Process 15 events in under 100ms."""
-        start = time.perf_counter()
-        for _ in range(100):
-            select_highlights(sample_game_events)
-        elapsed = (time.perf_counter() - start) / 100
+        # Best of 5 rounds of 20 calls: the minimum filters scheduler noise
+        elapsed = (
+            min(
+                timeit.repeat(
+                    lambda: select_highlights(sample_game_events), number=20, repeat=5
+                )
+            )
+            / 20
+        )
         assert elapsed < 0.1, f"Average time {elapsed:.4f}s exceeds 100ms"
 
-    def test_performance_1000_events(self) -> None:
+    def test_performance_1000_events(self, large_event_set: list[Any]) -> None:
         """SC-005: Process 1000 events in under 1 second."""
-        events = []
-        importances = ["critical", "high", "medium", "low"]
-        for i in range(1000):
-            events.append(
-                GameEvent(
-                    id=f"evt-{i:04d}",
-                    type="dunk",
-                    timestamp=f"Q{(i % 4) + 1} {i % 12:02d}:00",
-                    quarter=(i % 4) + 1,
-                    player=f"Player {i % 20}",
-                    team=f"Team {i % 4}",
-                    description=f"Event {i}",
-                    importance=importances[i % 4],
-                    tags=["clutch"] if i % 10 == 0 else [],
-                )
-            )
         start = time.perf_counter()
-        highlights = select_highlights(events)
+        highlights = select_highlights(large_event_set)
         elapsed = time.perf_counter() - start
         assert elapsed < 1.0, f"Time {elapsed:.4f}s exceeds 1 second"
         assert 5 <= len(highlights) <= 8
@@ -9,6 +9,7 @@ from highlight_selector.models import (
     Highlight,
     ScoreBreakdown,
     UserPreference,
+    IMPORTANCE_KEYS,
     IMPORTANCE_RANK,
 )
 
@@ -138,6 +139,11 @@ class TestGameEvent:
         restored = GameEvent.from_dict(d)
         assert restored == event
 
+    def test_uses_slots(self) -> None:
+        """Events are allocated per input row, so they carry no __dict__."""
+        event = GameEvent.from_dict({"id": "evt-011", "type": "dunk"})
+        assert not hasattr(event, "__dict__")
+
 
 class TestUserPreference:
     """Tests for the UserPreference dataclass."""
@@ -308,7 +314,8 @@ class TestImportanceRank:
     """Tests for the IMPORTANCE_RANK mapping."""
 
     def test_all_levels_present(self) -> None:
-        assert set(IMPORTANCE_RANK.keys()) == {"critical", "high", "medium", "low"}
+        assert IMPORTANCE_KEYS == {"critical", "high", "medium", "low"}
+        assert IMPORTANCE_KEYS == IMPORTANCE_RANK.keys()
 
     def test_ordering(self) -> None:
         assert IMPORTANCE_RANK["critical"] > IMPORTANCE_RANK["high"]
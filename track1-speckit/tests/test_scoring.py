@@ -33,49 +33,32 @@ def _make_event(
 class TestBaseScoring:
     """T023: Tests for base importance scoring."""
 
-    def test_critical_base_score(self) -> None:
-        event = _make_event(importance="critical")
-        breakdown = score_event(event)
-        assert breakdown.base_score == 100
-
-    def test_high_base_score(self) -> None:
-        event = _make_event(importance="high")
-        breakdown = score_event(event)
-        assert breakdown.base_score == 75
-
-    def test_medium_base_score(self) -> None:
-        event = _make_event(importance="medium")
-        breakdown = score_event(event)
-        assert breakdown.base_score == 50
-
-    def test_low_base_score(self) -> None:
-        event = _make_event(importance="low")
+    @pytest.mark.parametrize(
+        ("importance", "expected"),
+        [("critical", 100), ("high", 75), ("medium", 50), ("low", 25)],
+    )
+    def test_base_score(self, importance: str, expected: int) -> None:
+        event = _make_event(importance=importance)
         breakdown = score_event(event)
-        assert breakdown.base_score == 25
+        assert breakdown.base_score == expected
 
 
 class TestContextBoosts:
     """T024: Tests for context boosts from tags and quarter."""
 
-    def test_clutch_boost(self) -> None:
-        event = _make_event(tags=["clutch"])
-        breakdown = score_event(event)
-        assert breakdown.context_boosts.get("clutch") == 20
-
-    def test_highlight_reel_boost(self) -> None:
-        event = _make_event(tags=["highlight_reel"])
-        breakdown = score_event(event)
-        assert breakdown.context_boosts.get("highlight_reel") == 15
-
-    def test_game_winner_boost(self) -> None:
-        event = _make_event(tags=["game_winner"])
-        breakdown = score_event(event)
-        assert breakdown.context_boosts.get("game_winner") == 25
-
-    def test_buzzer_beater_boost(self) -> None:
-        event = _make_event(tags=["buzzer_beater"])
+    @pytest.mark.parametrize(
+        ("tag", "expected"),
+        [
+            ("clutch", 20),
+            ("highlight_reel", 15),
+            ("game_winner", 25),
+            ("buzzer_beater", 20),
+        ],
+    )
+    def test_tag_boost(self, tag: str, expected: int) -> None:
+        event = _make_event(tags=[tag])
         breakdown = score_event(event)
-        assert breakdown.context_boosts.get("buzzer_beater") == 20
+        assert breakdown.context_boosts.get(tag) == expected
 
     def test_fourth_quarter_boost(self) -> None:
         event = _make_event(quarter=4)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from itertools import pairwise
 from typing import Any
 
 import pytest
@@ -32,7 +33,7 @@ def _make_event(
     )
 
 
-def _make_events_with_varying_importance(count: int = 15) -> list[GameEvent]:
+def _build_varying_events(count: int = 15) -> list[GameEvent]:
     """Generate a diverse set of events for testing."""
     importances = [
         "critical",
@@ -66,24 +67,36 @@ def _make_events_with_varying_importance(count: int = 15) -> list[GameEvent]:
     return events
 
 
+@pytest.fixture(scope="module")
+def varying_events() -> tuple[GameEvent, ...]:
+    """Build the 15 diverse events once per module; tests never mutate them."""
+    return tuple(_build_varying_events(15))
+
+
 class TestRankingOrder:
     """T025: Tests for ranking (score descending), critical inclusion, and count constraints."""
 
-    def test_highlights_ranked_by_score_descending(self) -> None:
-        events = _make_events_with_varying_importance()
+    def test_highlights_ranked_by_score_descending(
+        self, varying_events: tuple[GameEvent, ...]
+    ) -> None:
+        events = list(varying_events)
         highlights = select_highlights(events)
         scores = [h.score for h in highlights]
-        assert scores == sorted(scores, reverse=True)
+        assert all(a >= b for a, b in pairwise(scores))
 
-    def test_returns_5_to_8_highlights(self) -> None:
+    def test_returns_5_to_8_highlights(
+        self, varying_events: tuple[GameEvent, ...]
+    ) -> None:
         """FR-005: System returns 5-8 highlights."""
-        events = _make_events_with_varying_importance(15)
+        events = list(varying_events)
         highlights = select_highlights(events)
         assert 5 <= len(highlights) <= 8
 
-    def test_critical_events_always_included(self) -> None:
+    def test_critical_events_always_included(
+        self, varying_events: tuple[GameEvent, ...]
+    ) -> None:
         """FR-006: All critical events must be in output."""
-        events = _make_events_with_varying_importance()
+        events = list(varying_events)
         highlights = select_highlights(events)
         critical_in_highlights = [
             h for h in highlights if h.event.importance == "critical"
@@ -91,8 +104,10 @@ class TestRankingOrder:
         critical_in_events = [e for e in events if e.importance == "critical"]
         assert len(critical_in_highlights) == len(critical_in_events)
 
-    def test_rank_values_are_sequential(self) -> None:
-        events = _make_events_with_varying_importance()
+    def test_rank_values_are_sequential(
+        self, varying_events: tuple[GameEvent, ...]
+    ) -> None:
+        events = list(varying_events)
         highlights = select_highlights(events)
         ranks = [h.rank for h in highlights]
         assert ranks == list(range(1, len(highlights) + 1))
@@ -110,10 +125,11 @@ class TestTieBreaking:
             _make_event(event_id=f"evt-f{i}", importance="low", quarter=1)
             for i in range(6)
         ]
-        highlights = select_highlights([evt_q2, evt_q4] + fillers)
+        highlights = select_highlights([evt_q2, evt_q4, *fillers])
+        by_id = {h.event.id: h for h in highlights}
         # Q4 event should rank higher than Q2 with same importance
-        q4_highlight = next(h for h in highlights if h.event.id == "evt-b")
-        q2_highlight = next(h for h in highlights if h.event.id == "evt-a")
+        q4_highlight = by_id["evt-b"]
+        q2_highlight = by_id["evt-a"]
         assert q4_highlight.rank < q2_highlight.rank
 
     def test_tie_break_by_importance_descending(self) -> None:
@@ -130,9 +146,10 @@ class TestTieBreaking:
             _make_event(event_id=f"evt-f{i}", importance="low", quarter=1)
             for i in range(6)
         ]
-        highlights = select_highlights([evt_high, evt_med_boost] + fillers)
-        high_hl = next(h for h in highlights if h.event.id == "evt-a")
-        med_hl = next(h for h in highlights if h.event.id == "evt-b")
+        highlights = select_highlights([evt_high, evt_med_boost, *fillers])
+        by_id = {h.event.id: h for h in highlights}
+        high_hl = by_id["evt-a"]
+        med_hl = by_id["evt-b"]
         assert high_hl.rank < med_hl.rank
 
     def test_tie_break_by_event_id_ascending(self) -> None:
@@ -143,17 +160,20 @@ class TestTieBreaking:
             _make_event(event_id=f"evt-f{i}", importance="low", quarter=1)
             for i in range(6)
         ]
-        highlights = select_highlights([evt_b, evt_a] + fillers)
-        hl_a = next(h for h in highlights if h.event.id == "evt-aaa")
-        hl_b = next(h for h in highlights if h.event.id == "evt-zzz")
+        highlights = select_highlights([evt_b, evt_a, *fillers])
+        by_id = {h.event.id: h for h in highlights}
+        hl_a = by_id["evt-aaa"]
+        hl_b = by_id["evt-zzz"]
         assert hl_a.rank < hl_b.rank
 
 
 class TestDeterminism:
     """T031: Verify identical inputs produce identical outputs (FR-009, SC-004)."""
 
-    def test_identical_inputs_produce_identical_outputs(self) -> None:
-        events = _make_events_with_varying_importance()
+    def test_identical_inputs_produce_identical_outputs(
+        self, varying_events: tuple[GameEvent, ...]
+    ) -> None:
+        events = list(varying_events)
         prefs = UserPreference(favorite_player="Player A")
 
         result1 = select_highlights(events, prefs)
@@ -166,8 +186,10 @@ class TestDeterminism:
             assert h1.score == h2.score
             assert h1.explanation == h2.explanation
 
-    def test_determinism_multiple_runs(self) -> None:
-        events = _make_events_with_varying_importance()
+    def test_determinism_multiple_runs(
+        self, varying_events: tuple[GameEvent, ...]
+    ) -> None:
+        events = list(varying_events)
         results = [select_highlights(events) for _ in range(10)]
         first = results[0]
         for result in results[1:]:
@@ -207,7 +229,7 @@ class TestPlayerSelection:
         prefs = UserPreference(favorite_player="LeBron James")
         highlights = select_highlights(events, prefs)
 
-        lebron_count = sum(1 for h in highlights if h.event.player == "LeBron James")
+        lebron_count = [h.event.player for h in highlights].count("LeBron James")
         assert (
             lebron_count >= len(highlights) / 2
         ), f"Expected at least 50% LeBron highlights, got {lebron_count}/{len(highlights)}"
@@ -242,9 +264,11 @@ class TestPlayerSelection:
         critical_ids = [h.event.id for h in highlights if h.event.id == "evt-crit"]
         assert len(critical_ids) == 1, "Critical non-player event must be included"
 
-    def test_no_favorite_player_events_fallback(self) -> None:
+    def test_no_favorite_player_events_fallback(
+        self, varying_events: tuple[GameEvent, ...]
+    ) -> None:
         """When no events match favorite player, fall back to basic selection."""
-        events = _make_events_with_varying_importance()
+        events = list(varying_events)
         prefs = UserPreference(favorite_player="Nonexistent Player")
         highlights = select_highlights(events, prefs)
         assert 5 <= len(highlights) <= 8
@@ -277,8 +301,9 @@ class TestTeamSelection:
 
         prefs = UserPreference(favorite_team="Lakers")
         highlights = select_highlights(events, prefs)
-        lakers_count = sum(1 for h in highlights if h.event.team == "Lakers")
-        celtics_count = sum(1 for h in highlights if h.event.team == "Celtics")
+        teams = [h.event.team for h in highlights]
+        lakers_count = teams.count("Lakers")
+        celtics_count = teams.count("Celtics")
         assert lakers_count > celtics_count
 
     def test_opponent_critical_play_included(self) -> None:
@@ -344,12 +369,9 @@ class TestTeamSelection:
         prefs = UserPreference(favorite_player="LeBron James", favorite_team="Lakers")
         highlights = select_highlights(events, prefs)
 
-        player_event = next(
-            (h for h in highlights if h.event.id == "evt-player-other-team"), None
-        )
-        team_event = next(
-            (h for h in highlights if h.event.id == "evt-team-other-player"), None
-        )
+        by_id = {h.event.id: h for h in highlights}
+        player_event = by_id.get("evt-player-other-team")
+        team_event = by_id.get("evt-team-other-player")
 
         # Player boost (+30) > team boost (+15), so player event should rank higher
         assert player_event is not None
@@ -15,6 +15,7 @@ Usage:
 """
 
 import json
+import sys
 from pathlib import Path
 from highlight_selector.models import GameEvent, UserPreference
 from highlight_selector.selector import select_highlights
@@ -29,11 +30,11 @@ def load_sample_data() -> list[GameEvent]:
         print("Creating minimal sample data for demo...")
         return create_minimal_sample_data()
     
-    with open(sample_path) as f:
-        data = json.load(f)
-        events = [GameEvent.from_dict(e) for e in data["events"]]
-        print(f"✅ Loaded {len(events)} events from sample data\n")
-        return events
+    # json.loads decodes UTF-8 bytes itself; no text-mode file wrapper needed
+    data = json.loads(sample_path.read_bytes())
+    events = [GameEvent.from_dict(e) for e in data["events"]]
+    print(f"✅ Loaded {len(events)} events from sample data\n")
+    return events
 
 
 def create_minimal_sample_data() -> list[GameEvent]:
@@ -120,17 +121,20 @@ def print_separator(title: str = "") -> None:
 def print_highlights(highlights, scenario: str) -> None:
     """Print highlights in a formatted way."""
     print_separator(f"Scenario: {scenario}")
-    print(f"Selected {len(highlights)} highlights:\n")
+    # Build the whole block and write it once instead of one print per line
+    lines = [f"Selected {len(highlights)} highlights:\n"]
     
     for h in highlights:
-        print(f"#{h.rank} | Score: {h.score:.1f}")
-        print(f"   {h.event.type.upper().replace('_', ' ')} - {h.event.description}")
-        print(f"   Player: {h.event.player} | Team: {h.event.team} | {h.event.timestamp}")
-        print(f"   Importance: {h.event.importance}")
+        lines.append(f"#{h.rank} | Score: {h.score:.1f}")
+        lines.append(f"   {h.event.type.upper().replace('_', ' ')} - {h.event.description}")
+        lines.append(f"   Player: {h.event.player} | Team: {h.event.team} | {h.event.timestamp}")
+        lines.append(f"   Importance: {h.event.importance}")
         if h.event.tags:
-            print(f"   Tags: {', '.join(h.event.tags)}")
-        print(f"   💡 {h.explanation}")
-        print()
+            lines.append(f"   Tags: {', '.join(h.event.tags)}")
+        lines.append(f"   💡 {h.explanation}")
+        lines.append("")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main() -> None:
@@ -141,14 +145,20 @@ def main() -> None:
     # Load data
     events = load_sample_data()
     
-    # Get unique players and teams
-    players = sorted(set(e.player for e in events))
-    teams = sorted(set(e.team for e in events))
+    # Get unique players and teams, and the last quarter, in one pass
+    player_set, team_set, max_quarter = set(), set(), 0
+    for e in events:
+        player_set.add(e.player)
+        team_set.add(e.team)
+        if e.quarter > max_quarter:
+            max_quarter = e.quarter
+    players = sorted(player_set)
+    teams = sorted(team_set)
     
     print(f"Sample contains:")
     print(f"  - Players: {', '.join(players)}")
     print(f"  - Teams: {', '.join(teams)}")
-    print(f"  - Quarters: Q1-Q{max(e.quarter for e in events)}")
+    print(f"  - Quarters: Q1-Q{max_quarter}")
     print()
     
     # Scenario 1: Objective selection (no preferences)
@@ -231,9 +241,9 @@ def main() -> None:
     
     if len(players) > 0:
         favorite_player = players[0]
-        player_events = [e for e in events if e.player == favorite_player]
-        print(f"\n⭐ {favorite_player} Events: {len(player_events)} found")
-        if len(player_events) >= 3:
+        player_event_count = sum(1 for e in events if e.player == favorite_player)
+        print(f"\n⭐ {favorite_player} Events: {player_event_count} found")
+        if player_event_count >= 3:
             print(f"   Rule: ≥50% of highlights must feature {favorite_player}")
             pref = UserPreference(favorite_player=favorite_player)
             highlights = select_highlights(events, pref, min_count=5, max_count=8)
@@ -6,12 +6,21 @@ including argument parsing, JSON input loading, and formatted output.
 
 import argparse
 import json
+import os
 import sys
-from pathlib import Path
 from typing import Any, Optional
 
 from highlight_selector.models import GameEvent, Highlight, UserPreference
-from highlight_selector.selector import select_highlights
+
+# GameEvent fields without defaults; checked up front so a malformed event
+# reports every missing field at once
+_REQUIRED_EVENT_FIELDS = frozenset(
+    "id type timestamp quarter player team description importance".split()
+)
+_EXPECTED_FIELDS_HINT = (
+    "Expected fields: id, type, timestamp, quarter, player, team, "
+    "description, importance, tags"
+)
 
 
 def load_json_input(file_path: str) -> dict[str, Any]:
@@ -27,24 +36,29 @@ def load_json_input(file_path: str) -> dict[str, Any]:
         FileNotFoundError: If file doesn't exist.
         json.JSONDecodeError: If file contains invalid JSON.
     """
-    path = Path(file_path)
-    if not path.exists():
+    if not os.path.exists(file_path):
         raise FileNotFoundError(f"Input file not found: {file_path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        data: dict[str, Any] = json.load(f)
+    # json.loads decodes UTF-8 bytes directly, skipping a text-mode read
+    with open(file_path, "rb") as f:
+        data: dict[str, Any] = json.loads(f.read())
 
     return data
 
 
-def validate_and_parse_events(events_data: list[dict[str, Any]]) -> list[GameEvent]:
-    """Validate and parse event data into GameEvent objects.
+def _parse_and_index(
+    events_data: list[dict[str, Any]], need_players: bool, need_teams: bool
+) -> tuple[list[GameEvent], set[str], set[str]]:
+    """Parse events and collect player/team names in the same pass.
 
     Args:
         events_data: List of event dictionaries from JSON.
+        need_players: Collect the set of player names.
+        need_teams: Collect the set of team names.
 
     Returns:
-        List of validated GameEvent objects.
+        Tuple of (parsed events, player names, team names). A name set is
+        empty when it was not requested.
 
     Raises:
         ValueError: If events data is invalid or missing required fields.
@@ -53,20 +67,79 @@ def validate_and_parse_events(events_data: list[dict[str, Any]]) -> list[GameEve
         raise ValueError("No events found in input data")
 
     events: list[GameEvent] = []
+    players: set[str] = set()
+    teams: set[str] = set()
     for idx, event_dict in enumerate(events_data):
+        if isinstance(event_dict, dict):
+            missing = _REQUIRED_EVENT_FIELDS.difference(event_dict)
+            if missing:
+                raise ValueError(
+                    f"Invalid event data at index {idx}: missing fields "
+                    f"{', '.join(sorted(missing))}. {_EXPECTED_FIELDS_HINT}"
+                )
         try:
             event = GameEvent.from_dict(event_dict)
             events.append(event)
         except (KeyError, TypeError) as e:
+            # Unknown fields or a non-object entry
             raise ValueError(
-                f"Invalid event data at index {idx}: {e}. "
-                f"Expected fields: id, type, timestamp, quarter, player, team, "
-                f"description, importance, tags"
+                f"Invalid event data at index {idx}: {e}. {_EXPECTED_FIELDS_HINT}"
             )
+        if need_players:
+            players.add(event.player)
+        if need_teams:
+            teams.add(event.team)
+
+    return events, players, teams
+
+
+def validate_and_parse_events(events_data: list[dict[str, Any]]) -> list[GameEvent]:
+    """Validate and parse event data into GameEvent objects.
 
+    Args:
+        events_data: List of event dictionaries from JSON.
+
+    Returns:
+        List of validated GameEvent objects.
+
+    Raises:
+        ValueError: If events data is invalid or missing required fields.
+    """
+    events, _, _ = _parse_and_index(events_data, need_players=False, need_teams=False)
     return events
 
 
+def _check_preferences(
+    player: Optional[str],
+    team: Optional[str],
+    available_players: set[str],
+    available_teams: set[str],
+) -> Optional[UserPreference]:
+    """Validate preferences against precollected player and team names.
+
+    Raises:
+        ValueError: If specified player/team is not among the available names.
+    """
+    if not player and not team:
+        return None
+
+    # Validate player exists in events
+    if player and player not in available_players:
+        raise ValueError(
+            f"Player '{player}' not found in events. "
+            f"Available players: {', '.join(sorted(available_players))}"
+        )
+
+    # Validate team exists in events
+    if team and team not in available_teams:
+        raise ValueError(
+            f"Team '{team}' not found in events. "
+            f"Available teams: {', '.join(sorted(available_teams))}"
+        )
+
+    return UserPreference(favorite_player=player, favorite_team=team)
+
+
 def validate_preferences(
     player: Optional[str], team: Optional[str], events: list[GameEvent]
 ) -> Optional[UserPreference]:
@@ -86,25 +159,16 @@ def validate_preferences(
     if not player and not team:
         return None
 
-    # Validate player exists in events
-    if player:
-        available_players = {evt.player for evt in events}
-        if player not in available_players:
-            raise ValueError(
-                f"Player '{player}' not found in events. "
-                f"Available players: {', '.join(sorted(available_players))}"
-            )
+    # Collect only the requested columns in a single pass over events
+    available_players: set[str] = set()
+    available_teams: set[str] = set()
+    for evt in events:
+        if player:
+            available_players.add(evt.player)
+        if team:
+            available_teams.add(evt.team)
 
-    # Validate team exists in events
-    if team:
-        available_teams = {evt.team for evt in events}
-        if team not in available_teams:
-            raise ValueError(
-                f"Team '{team}' not found in events. "
-                f"Available teams: {', '.join(sorted(available_teams))}"
-            )
-
-    return UserPreference(favorite_player=player, favorite_team=team)
+    return _check_preferences(player, team, available_players, available_teams)
 
 
 def format_highlight_output(
@@ -127,18 +191,20 @@ def format_highlight_output(
     lines.append("=" * 60)
     lines.append("")
 
+    # One multi-line block per highlight; its trailing newline becomes the
+    # blank separator line once joined
     for highlight in highlights:
         event = highlight.event
-        lines.append(f"#{highlight.rank} | Score: {highlight.score:.1f}")
-        lines.append(f"   {event.type.upper()} - {event.description}")
+        tags_line = f"   Tags: {', '.join(event.tags)}\n" if event.tags else ""
         lines.append(
-            f"   Player: {event.player} | Team: {event.team} | Q{event.quarter} {event.timestamp}"
+            f"#{highlight.rank} | Score: {highlight.score:.1f}\n"
+            f"   {event.type.upper()} - {event.description}\n"
+            f"   Player: {event.player} | Team: {event.team} | "
+            f"Q{event.quarter} {event.timestamp}\n"
+            f"   Importance: {event.importance}\n"
+            f"{tags_line}"
+            f"   💡 {highlight.explanation}\n"
         )
-        lines.append(f"   Importance: {event.importance}")
-        if event.tags:
-            lines.append(f"   Tags: {', '.join(event.tags)}")
-        lines.append(f"   💡 {highlight.explanation}")
-        lines.append("")
 
     return "\n".join(lines)
 
@@ -158,30 +224,14 @@ def apply_only_filter(
     if not preference:
         return highlights
 
-    filtered: list[Highlight] = []
-    for h in highlights:
-        matches = False
-        if preference.favorite_player and h.event.player == preference.favorite_player:
-            matches = True
-        if preference.favorite_team and h.event.team == preference.favorite_team:
-            matches = True
-
-        if matches:
-            filtered.append(h)
+    # Unset preferences contribute empty target sets, so they never match
+    players = {preference.favorite_player} if preference.favorite_player else set()
+    teams = {preference.favorite_team} if preference.favorite_team else set()
 
-    return filtered
+    return [h for h in highlights if h.event.player in players or h.event.team in teams]
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse command-line arguments.
-
-    Returns:
-        Parsed arguments namespace.
-    """
-    parser = argparse.ArgumentParser(
-        description="AI Highlight Selector - Select and rank game highlights",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_HELP_EPILOG = """
 Examples:
   # Objective selection (no preferences)
   python -m highlight_selector.cli input.json
@@ -197,7 +247,25 @@ Examples:
 
   # Only show favorite player's highlights
   python -m highlight_selector.cli input.json --player "LeBron James" --only
-""",
+
+  # Indented JSON output
+  python -m highlight_selector.cli input.json --json-output --pretty
+"""
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Args:
+        argv: Argument list to parse, or None to use sys.argv[1:].
+
+    Returns:
+        Parsed arguments namespace.
+    """
+    parser = argparse.ArgumentParser(
+        description="AI Highlight Selector - Select and rank game highlights",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_HELP_EPILOG,
     )
 
     parser.add_argument(
@@ -245,27 +313,43 @@ Examples:
         help="Output results in JSON format instead of human-readable",
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent --json-output for reading (default: compact)",
+    )
+
+    return parser.parse_args(argv)
 
 
-def main() -> int:
+def main(argv: Optional[list[str]] = None) -> int:
     """Main CLI entry point.
 
+    Args:
+        argv: Argument list to parse, or None to use sys.argv[1:].
+
     Returns:
         Exit code (0 for success, 1 for error).
     """
     try:
-        args = parse_args()
+        args = parse_args(argv)
+
+        # Imported here so --help and argument errors skip loading the selector
+        from highlight_selector.selector import select_highlights
 
         # Load input data
         data = load_json_input(args.input_file)
 
-        # Parse events
+        # Parse events, collecting only the names the preferences need
         events_data = data.get("events", [])
-        events = validate_and_parse_events(events_data)
+        events, available_players, available_teams = _parse_and_index(
+            events_data, need_players=bool(args.player), need_teams=bool(args.team)
+        )
 
         # Validate and create preferences
-        preference = validate_preferences(args.player, args.team, events)
+        preference = _check_preferences(
+            args.player, args.team, available_players, available_teams
+        )
 
         # Run selection
         highlights = select_highlights(
@@ -289,11 +373,16 @@ def main() -> int:
                 "highlights": [h.to_dict() for h in highlights],
                 "count": len(highlights),
             }
-            print(json.dumps(output_data, indent=2))
+            if args.pretty:
+                output = json.dumps(output_data, indent=2)
+            else:
+                output = json.dumps(output_data, separators=(",", ":"))
         else:
             # Human-readable output
             output = format_highlight_output(highlights)
-            print(output)
+
+        # One write for the whole report instead of print's separate newline write
+        sys.stdout.write(output + "\n")
 
         return 0
 
@@ -7,11 +7,27 @@ This module defines the core data structures used throughout the system:
 - Highlight: Output model packaging selected events with metadata
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Optional, Union
 
+# Slotted dataclasses drop the per-instance __dict__ (smaller objects, faster
+# attribute access). dataclass(slots=True) needs Python 3.10; on 3.9 the
+# models fall back to regular dataclasses with identical behavior.
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+def _intern(value: Any) -> Any:
+    """Intern a string so repeated names, types and tags share one object.
+
+    Player, team, type, importance and tag values recur across events and are
+    compared against preferences and lookup tables, where interned strings
+    match by identity. Non-string values are returned unchanged.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(**_SLOTS)
 class GameEvent:
     """Represents a single game event with metadata and importance scoring.
 
@@ -59,6 +75,13 @@ class GameEvent:
     importance: str  # "critical", "high", "medium", or "low"
     tags: list[str] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        """Intern the repeated string fields, however the event was built."""
+        self.type = _intern(self.type)
+        self.player = _intern(self.player)
+        self.team = _intern(self.team)
+        self.importance = _intern(self.importance)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert GameEvent to dictionary for JSON serialization.
 
@@ -74,7 +97,7 @@ class GameEvent:
             "team": self.team,
             "description": self.description,
             "importance": self.importance,
-            "tags": self.tags,
+            "tags": list(self.tags),
         }
 
     @classmethod
@@ -87,10 +110,12 @@ class GameEvent:
         Returns:
             GameEvent instance.
         """
+        if "tags" in data:
+            data = {**data, "tags": [_intern(tag) for tag in data["tags"]]}
         return cls(**data)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class UserPreference:
     """User personalization settings for highlight selection.
 
@@ -129,6 +154,11 @@ class UserPreference:
     favorite_player: Optional[str] = None
     favorite_team: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        """Intern favorites so matches against interned event fields hit by identity."""
+        self.favorite_player = _intern(self.favorite_player)
+        self.favorite_team = _intern(self.favorite_team)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert UserPreference to dictionary for JSON serialization.
 
@@ -154,7 +184,7 @@ class UserPreference:
         return cls(**data)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScoreBreakdown:
     """Transparent breakdown showing how an event's score was calculated.
 
@@ -203,7 +233,7 @@ class ScoreBreakdown:
             "base_score": self.base_score,
             "player_boost": self.player_boost,
             "team_boost": self.team_boost,
-            "context_boosts": self.context_boosts,
+            "context_boosts": dict(self.context_boosts),
             "total_score": self.total_score,
         }
 
@@ -220,7 +250,7 @@ class ScoreBreakdown:
         return cls(**data)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Highlight:
     """Output model packaging a selected event with its metadata.
 
@@ -5,6 +5,7 @@ and selecting the most important highlights based on importance, user
 preferences, and context tags.
 """
 
+import heapq
 from typing import Optional, Tuple, Union
 
 from highlight_selector.models import (
@@ -14,9 +15,17 @@ from highlight_selector.models import (
     UserPreference,
 )
 
-
 # Story 2.1: Base Importance Scoring
 
+# Module-level lookup tables, shared by every scoring and sort-key call
+_IMPORTANCE_SCORES: dict[str, int] = {
+    "critical": 100,
+    "high": 75,
+    "medium": 50,
+    "low": 25,
+}
+_IMPORTANCE_RANK: dict[str, int] = {"critical": 4, "high": 3, "medium": 2, "low": 1}
+
 
 def calculate_base_score(event: GameEvent) -> int:
     """Calculate base score from event importance level.
@@ -39,13 +48,7 @@ def calculate_base_score(event: GameEvent) -> int:
         >>> calculate_base_score(event)
         100
     """
-    importance_map = {
-        "critical": 100,
-        "high": 75,
-        "medium": 50,
-        "low": 25,
-    }
-    return importance_map.get(event.importance, 25)  # Default to low (25)
+    return _IMPORTANCE_SCORES.get(event.importance, 25)  # Default to low (25)
 
 
 # Story 2.2: Player Preference Boost
@@ -116,6 +119,15 @@ def calculate_team_boost(event: GameEvent, preference: Optional[UserPreference])
 
 # Story 2.4: Context Tag Boosts
 
+# Built once at import; looked up for every tag of every scored event
+_CONTEXT_TAG_BOOSTS: dict[str, int] = {
+    "clutch": 20,
+    "game_winner": 25,
+    "buzzer_beater": 15,
+    "highlight_reel": 15,
+    "fourth_quarter": 10,
+}
+
 
 def calculate_context_boosts(event: GameEvent) -> dict[str, Union[int, float]]:
     """Calculate score boosts based on event context tags.
@@ -149,19 +161,12 @@ def calculate_context_boosts(event: GameEvent) -> dict[str, Union[int, float]]:
         >>> sum(boosts.values())
         30
     """
-    tag_boost_map = {
-        "clutch": 20,
-        "game_winner": 25,
-        "buzzer_beater": 15,
-        "highlight_reel": 15,
-        "fourth_quarter": 10,
+    boosts: dict[str, Union[int, float]] = {
+        tag: _CONTEXT_TAG_BOOSTS[tag]
+        for tag in event.tags
+        if tag in _CONTEXT_TAG_BOOSTS
     }
 
-    boosts: dict[str, Union[int, float]] = {}
-    for tag in event.tags:
-        if tag in tag_boost_map:
-            boosts[tag] = tag_boost_map[tag]
-
     return boosts
 
 
@@ -224,12 +229,34 @@ def calculate_score(
 
 # Story 3.1, 3.2: Sorting and Tie-Breaking
 
+# (event, total score) pair used while ranking; full breakdowns are only
+# built for the events that end up selected
+_ScoredEvent = Tuple[GameEvent, Union[int, float]]
 
-def _create_sort_key(
-    event: GameEvent, score: Union[int, float]
-) -> Tuple[Union[int, float], int, int, str]:
+
+def _total_score(
+    event: GameEvent, preference: Optional[UserPreference]
+) -> Union[int, float]:
+    """Compute calculate_score(event, preference).total_score without a breakdown.
+
+    Skips building the per-event ScoreBreakdown; every component comes from
+    the same scoring functions calculate_score uses, so rankings always
+    match the displayed scores.
+    """
+    return (
+        calculate_base_score(event)
+        + calculate_player_boost(event, preference)
+        + calculate_team_boost(event, preference)
+        + sum(calculate_context_boosts(event).values())
+    )
+
+
+def _create_sort_key(item: _ScoredEvent) -> Tuple[Union[int, float], int, int, str]:
     """Create sort key for deterministic tie-breaking.
 
+    Used directly as the ``key`` function for sort/heapq, so it takes the
+    (event, score) pair rather than separate arguments.
+
     Tie-breaking order:
     1. Score (descending)
     2. Quarter (descending: 4 > 3 > 2 > 1)
@@ -237,17 +264,20 @@ def _create_sort_key(
     4. Event ID (ascending: lexicographic)
 
     Args:
-        event: GameEvent to create key for.
-        score: Calculated score for the event.
+        item: (GameEvent, calculated score) pair to create key for.
 
     Returns:
         Tuple for sorting: (negative_score, negative_quarter, negative_importance, id)
     """
-    importance_rank = {"critical": 4, "high": 3, "medium": 2, "low": 1}
-    importance_value = importance_rank.get(event.importance, 0)
+    event, score = item
 
     # Negative values for descending sort
-    return (-score, -event.quarter, -importance_value, event.id)
+    return (
+        -score,
+        -event.quarter,
+        -_IMPORTANCE_RANK.get(event.importance, 0),
+        event.id,
+    )
 
 
 # Story 3.3, 3.4, 3.5, 3.6: Main Selection Logic
@@ -262,7 +292,7 @@ def select_highlights(
     """Select and rank highlights from a list of game events.
 
     Main entry point for highlight selection. Orchestrates all selection rules:
-    - Scores all events using calculate_score()
+    - Scores all events, building calculate_score() breakdowns only for selected ones
     - Sorts by score with deterministic tie-breaking
     - Force-includes all critical importance events
     - Selects 5-8 highlights (or all if fewer than 5)
@@ -311,36 +341,34 @@ def select_highlights(
     if not events:
         return []
 
-    # Step 1: Score all events
-    scored_events: list[Tuple[GameEvent, ScoreBreakdown]] = []
-    for event in events:
-        breakdown = calculate_score(event, preference)
-        scored_events.append((event, breakdown))
+    # Step 1: Score all events (totals only; breakdowns come in step 6)
+    scored_events: list[_ScoredEvent] = [
+        (event, _total_score(event, preference)) for event in events
+    ]
 
-    # Step 2: Sort by score with deterministic tie-breaking
-    scored_events.sort(key=lambda x: _create_sort_key(x[0], x[1].total_score))
+    # Step 2: Force-include all critical events (single partitioning pass)
+    critical_events: list[_ScoredEvent] = []
+    non_critical_events: list[_ScoredEvent] = []
+    for item in scored_events:
+        if item[0].importance == "critical":
+            critical_events.append(item)
+        else:
+            non_critical_events.append(item)
 
-    # Step 3: Force-include all critical events
-    critical_events = [
-        (evt, score) for evt, score in scored_events if evt.importance == "critical"
-    ]
-    non_critical_events = [
-        (evt, score) for evt, score in scored_events if evt.importance != "critical"
-    ]
+    # Step 3: Sort by score with deterministic tie-breaking
+    critical_events.sort(key=_create_sort_key)
 
     # Step 4: Apply 5-8 selection logic to NON-CRITICAL events only
-    # Critical events are always included on top of this
-    num_non_critical = len(non_critical_events)
-
-    if num_non_critical <= min_count:
-        # Include all non-critical
-        selected_non_critical = non_critical_events
-    elif num_non_critical <= max_count:
-        # Include all non-critical (within range)
-        selected_non_critical = non_critical_events
+    # Critical events are always included on top of this.
+    # At most min_count, or within range: include all non-critical;
+    # more than max: take top max_count non-critical events, which a bounded
+    # heap finds in O(N log max_count) without sorting the rest
+    if len(non_critical_events) > max(min_count, max_count):
+        selected_non_critical = heapq.nsmallest(
+            max_count, non_critical_events, key=_create_sort_key
+        )
     else:
-        # More than max: take top max_count non-critical events
-        selected_non_critical = non_critical_events[:max_count]
+        selected_non_critical = sorted(non_critical_events, key=_create_sort_key)
 
     # Combine critical (always all) + selected non-critical
     selected = critical_events + selected_non_critical
@@ -351,7 +379,8 @@ def select_highlights(
 
     # Step 6: Assign ranks and create Highlight objects
     highlights: list[Highlight] = []
-    for rank, (event, breakdown) in enumerate(selected, start=1):
+    for rank, (event, _) in enumerate(selected, start=1):
+        breakdown = calculate_score(event, preference)
         explanation = _generate_explanation(event, breakdown, preference)
         highlight = Highlight(
             event=event,
@@ -365,64 +394,47 @@ def select_highlights(
 
 
 def _apply_favorite_player_rule(
-    scored_events: list[Tuple[GameEvent, ScoreBreakdown]],
+    scored_events: list[_ScoredEvent],
     favorite_player: str,
-) -> list[Tuple[GameEvent, ScoreBreakdown]]:
+) -> list[_ScoredEvent]:
     """Apply 50% favorite player representation rule.
 
     If at least 3 events featuring the favorite player exist in the input,
     ensure at least 50% of the selection features that player.
 
     Args:
-        scored_events: List of (event, breakdown) tuples, already sorted.
+        scored_events: List of (event, total score) tuples, already sorted.
         favorite_player: Name of favorite player.
 
     Returns:
         Modified list ensuring 50% representation if rule applies.
     """
-    # Count how many favorite player events are available
-    fav_events = [
-        (evt, score) for evt, score in scored_events if evt.player == favorite_player
-    ]
+    # Split the selection into favorite and non-favorite events in one pass;
+    # both halves keep the selection's order
+    fav_in_selection: list[_ScoredEvent] = []
+    non_fav_in_selection: list[_ScoredEvent] = []
+    for item in scored_events:
+        if item[0].player == favorite_player:
+            fav_in_selection.append(item)
+        else:
+            non_fav_in_selection.append(item)
 
     # Rule only applies if ≥3 favorite player events exist
-    if len(fav_events) < 3:
+    current_fav_count = len(fav_in_selection)
+    if current_fav_count < 3:
         return scored_events
 
     # Calculate required count (50% of selection)
     selection_size = len(scored_events)
     required_fav_count = (selection_size + 1) // 2  # Round up
 
-    # Count how many favorite player events are already in selection
-    current_fav_count = sum(
-        1 for evt, _ in scored_events if evt.player == favorite_player
-    )
-
     # If already meeting requirement, return as-is
     if current_fav_count >= required_fav_count:
         return scored_events
 
-    # Need to add more favorite player events
-    # Split selection into favorite and non-favorite
-    fav_in_selection = [
-        (evt, score) for evt, score in scored_events if evt.player == favorite_player
-    ]
-    non_fav_in_selection = [
-        (evt, score) for evt, score in scored_events if evt.player != favorite_player
-    ]
-
-    # Get additional favorite player events not yet selected
-    # (They must exist since we have ≥3 total and need more)
-    all_fav_events = [
-        (evt, score) for evt, score in scored_events if evt.player == favorite_player
-    ]
-
-    # Calculate how many more we need
-    needed = required_fav_count - current_fav_count
-
     # Take top favorite player events to meet the requirement
     # This maintains score-based ranking
-    selected_fav = all_fav_events[:required_fav_count]
+    selected_fav = fav_in_selection[:required_fav_count]
 
     # Take remaining slots from non-favorite events
     remaining_slots = selection_size - len(selected_fav)
@@ -430,11 +442,27 @@ def _apply_favorite_player_rule(
 
     # Merge and re-sort by original scoring
     combined = selected_fav + selected_non_fav
-    combined.sort(key=lambda x: _create_sort_key(x[0], x[1].total_score))
+    combined.sort(key=_create_sort_key)
 
     return combined
 
 
+# Explanation phrases, looked up for every selected highlight
+_IMPORTANCE_PHRASES: dict[str, str] = {
+    "critical": "Critical game moment",
+    "high": "High-impact play",
+    "medium": "Notable play",
+    "low": "Contributing play",
+}
+_TAG_PHRASES: dict[str, str] = {
+    "clutch": "in a clutch situation",
+    "game_winner": "as the game-winner",
+    "buzzer_beater": "at the buzzer",
+    "highlight_reel": "with highlight-reel quality",
+    "fourth_quarter": "in the critical fourth quarter",
+}
+
+
 def _generate_explanation(
     event: GameEvent, breakdown: ScoreBreakdown, preference: Optional[UserPreference]
 ) -> str:
@@ -452,13 +480,7 @@ def _generate_explanation(
         String explanation (1-2 sentences).
     """
     # Start with importance-based phrase
-    importance_phrases = {
-        "critical": "Critical game moment",
-        "high": "High-impact play",
-        "medium": "Notable play",
-        "low": "Contributing play",
-    }
-    parts = [importance_phrases.get(event.importance, "Notable play")]
+    parts = [_IMPORTANCE_PHRASES.get(event.importance, "Notable play")]
 
     # Add personalization context
     if breakdown.player_boost > 0:
@@ -466,19 +488,13 @@ def _generate_explanation(
     elif breakdown.team_boost > 0:
         parts.append(f"by your favorite team {event.team}")
 
-    # Add context tags
-    if breakdown.context_boosts:
-        tag_phrases = {
-            "clutch": "in a clutch situation",
-            "game_winner": "as the game-winner",
-            "buzzer_beater": "at the buzzer",
-            "highlight_reel": "with highlight-reel quality",
-            "fourth_quarter": "in the critical fourth quarter",
-        }
-        for tag in breakdown.context_boosts:
-            if tag in tag_phrases:
-                parts.append(tag_phrases[tag])
-                break  # Only add one context phrase
+    # Add context tags (only the first recognized one gets a phrase)
+    tag_phrase = next(
+        (_TAG_PHRASES[tag] for tag in breakdown.context_boosts if tag in _TAG_PHRASES),
+        None,
+    )
+    if tag_phrase is not None:
+        parts.append(tag_phrase)
 
     # Combine into sentence
     if len(parts) == 1:
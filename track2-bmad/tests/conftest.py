@@ -0,0 +1,65 @@
+"""Shared pytest fixtures for the highlight selector tests."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from highlight_selector.models import GameEvent
+
+SAMPLE_DATA_PATH = Path(__file__).parent.parent.parent / "shared" / "sample_data.json"
+
+
+_SYNTHETIC_IMPORTANCE = ("critical", "high", "medium", "low")
+
+
+def _synthetic_events_data():
+    """Minimal 12-event game used when the shared sample file is missing."""
+    return [
+        {
+            "id": f"evt-{i:03d}",
+            "type": "play",
+            "timestamp": f"Q{i//3+1} 00:00",
+            "quarter": i // 3 + 1,
+            "player": f"Player{i % 3 + 1}",
+            "team": "TEAM" if i % 2 == 0 else "OPPONENT",
+            "description": f"Event {i}",
+            "importance": _SYNTHETIC_IMPORTANCE[i % 4],
+            "tags": ["clutch"] if i % 5 == 0 else [],
+        }
+        for i in range(12)
+    ]
+
+
+@pytest.fixture(scope="session")
+def sample_events():
+    """Sample game events, loaded and parsed once per test session.
+
+    Tests must not mutate the returned events.
+    """
+    if SAMPLE_DATA_PATH.exists():
+        # json.loads decodes UTF-8 bytes directly, skipping a text-mode read
+        events_data = json.loads(SAMPLE_DATA_PATH.read_bytes()).get("events", [])
+    else:
+        events_data = _synthetic_events_data()
+
+    return [GameEvent.from_dict(evt) for evt in events_data]
+
+
+@pytest.fixture(scope="module")
+def sample_event():
+    """Canonical touchdown event shared by the model tests in a module.
+
+    Tests must not mutate it.
+    """
+    return GameEvent(
+        id="evt1",
+        type="touchdown",
+        timestamp="10:23",
+        quarter=3,
+        player="J.Allen",
+        team="BUF",
+        description="15-yard TD pass",
+        importance="critical",
+        tags=["offensive"],
+    )
@@ -1,8 +1,6 @@
 """Unit tests for CLI module."""
 
 import json
-import tempfile
-from pathlib import Path
 
 import pytest
 
@@ -10,15 +8,16 @@ from highlight_selector.cli import (
     apply_only_filter,
     format_highlight_output,
     load_json_input,
+    main,
     validate_and_parse_events,
     validate_preferences,
 )
 from highlight_selector.models import GameEvent, Highlight, UserPreference
 
 
-@pytest.fixture
-def sample_json_file():
-    """Create a temporary JSON file with sample data."""
+@pytest.fixture(scope="session")
+def sample_json_file(tmp_path_factory):
+    """Create a temporary JSON file with sample data, once per session."""
     data = {
         "events": [
             {
@@ -46,14 +45,10 @@ def sample_json_file():
         ]
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(data, f)
-        temp_path = f.name
-
-    yield temp_path
-
-    # Cleanup
-    Path(temp_path).unlink()
+    # pytest removes tmp_path_factory directories itself
+    path = tmp_path_factory.mktemp("data") / "sample.json"
+    path.write_text(json.dumps(data))
+    return str(path)
 
 
 # Story 5.2: JSON Input Loading Tests
@@ -72,17 +67,13 @@ def test_load_json_input_file_not_found():
         load_json_input("nonexistent_file.json")
 
 
-def test_load_json_input_invalid_json():
+def test_load_json_input_invalid_json(tmp_path):
     """Verify JSONDecodeError for invalid JSON."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        f.write("{ invalid json }")
-        temp_path = f.name
+    invalid_path = tmp_path / "invalid.json"
+    invalid_path.write_text("{ invalid json }")
 
-    try:
-        with pytest.raises(json.JSONDecodeError):
-            load_json_input(temp_path)
-    finally:
-        Path(temp_path).unlink()
+    with pytest.raises(json.JSONDecodeError):
+        load_json_input(str(invalid_path))
 
 
 # Story 5.3: Validation Tests
@@ -131,6 +122,19 @@ def test_validate_and_parse_events_missing_field():
         validate_and_parse_events(events_data)
 
 
+def test_validate_and_parse_events_lists_all_missing_fields():
+    """Verify every missing required field is reported in one error."""
+    events_data = [{"id": "evt1", "type": "touchdown", "quarter": 4}]
+
+    with pytest.raises(ValueError) as exc_info:
+        validate_and_parse_events(events_data)
+
+    message = str(exc_info.value)
+    assert "index 0" in message
+    for field_name in ("timestamp", "player", "team", "description", "importance"):
+        assert field_name in message.split("Expected fields")[0]
+
+
 def test_validate_preferences_both_fields():
     """Verify preference validation with both player and team."""
     events = [
@@ -277,6 +281,33 @@ def test_format_highlight_output_multiple():
     assert "#3" in output
 
 
+# Story 5.5: JSON Output Format Tests
+
+
+def test_main_json_output_is_compact_by_default(sample_json_file, capsys):
+    """Verify --json-output prints one compact JSON line."""
+    assert main([sample_json_file, "--json-output"]) == 0
+
+    output = capsys.readouterr().out
+    assert output.endswith("\n")
+    body = output[:-1]
+    assert "\n" not in body
+    assert body == json.dumps(json.loads(body), separators=(",", ":"))
+
+
+def test_main_json_output_pretty_is_indented(sample_json_file, capsys):
+    """Verify --pretty keeps the indented format and the same data."""
+    assert main([sample_json_file, "--json-output"]) == 0
+    compact = capsys.readouterr().out
+
+    assert main([sample_json_file, "--json-output", "--pretty"]) == 0
+    pretty = capsys.readouterr().out
+
+    data = json.loads(compact)
+    assert json.loads(pretty) == data
+    assert pretty == json.dumps(data, indent=2) + "\n"
+
+
 # Story 5.6: --only Flag Tests
 
 
@@ -1,52 +1,25 @@
 """End-to-end integration tests using real sample data."""
 
 import json
-from pathlib import Path
 
 from highlight_selector.models import GameEvent, UserPreference
 from highlight_selector.selector import select_highlights
 
 
-def test_end_to_end_with_sample_data():
+def test_end_to_end_with_sample_data(sample_events):
     """Test complete workflow with sample data from shared folder."""
-    # Load sample data
-    sample_path = Path(__file__).parent.parent.parent / "shared" / "sample_data.json"
-
-    if not sample_path.exists():
-        # Create minimal sample if file doesn't exist
-        events_data = [
-            {
-                "id": f"evt-{i:03d}",
-                "type": "play",
-                "timestamp": f"Q{i//3+1} 00:00",
-                "quarter": i // 3 + 1,
-                "player": f"Player{i % 3 + 1}",
-                "team": "TEAM" if i % 2 == 0 else "OPPONENT",
-                "description": f"Event {i}",
-                "importance": ["critical", "high", "medium", "low"][i % 4],
-                "tags": ["clutch"] if i % 5 == 0 else [],
-            }
-            for i in range(12)
-        ]
-    else:
-        with open(sample_path) as f:
-            data = json.load(f)
-            events_data = data.get("events", [])
-
-    # Parse events
-    events = [GameEvent.from_dict(evt) for evt in events_data]
+    events = sample_events
 
     # Test objective selection
     highlights = select_highlights(events, None)
     # Selection can exceed max_count when critical events are present
-    critical_events = [e for e in events if e.importance == "critical"]
     expected_min = min(5, len(events))
     assert len(highlights) >= expected_min
     # All critical events should be included
-    critical_ids = {e.id for e in critical_events}
+    critical_ids = {e.id for e in events if e.importance == "critical"}
     highlight_ids = {h.event.id for h in highlights}
     assert critical_ids.issubset(highlight_ids)
-    assert all(h.rank == idx + 1 for idx, h in enumerate(highlights))
+    assert [h.rank for h in highlights] == list(range(1, len(highlights) + 1))
     assert all(h.explanation for h in highlights)
 
     # Test with preferences
@@ -71,87 +44,76 @@ def test_end_to_end_with_sample_data():
             assert any(h.score > 75 for h in player_events)
 
 
-def test_end_to_end_critical_event_handling():
-    """Test that critical events are always included."""
-    events = [
-        GameEvent(
-            id=f"crit{i}",
-            type="play",
-            timestamp="00:00",
-            quarter=4,
-            player="Player",
-            team="TEAM",
-            description="Critical play",
-            importance="critical",
-        )
-        for i in range(10)
-    ]
-
-    # Add some non-critical
-    events.extend(
-        [
-            GameEvent(
-                id=f"norm{i}",
-                type="play",
-                timestamp="00:00",
-                quarter=1,
-                player="Player",
-                team="TEAM",
-                description="Normal play",
-                importance="medium",
-            )
-            for i in range(5)
-        ]
+# 10 critical events (more than the normal max of 8) plus 5 non-critical ones;
+# built once at import, never mutated by the selector
+_CRITICAL_HANDLING_EVENTS = tuple(
+    GameEvent(
+        id=f"crit{i}",
+        type="play",
+        timestamp="00:00",
+        quarter=4,
+        player="Player",
+        team="TEAM",
+        description="Critical play",
+        importance="critical",
+    )
+    for i in range(10)
+) + tuple(
+    GameEvent(
+        id=f"norm{i}",
+        type="play",
+        timestamp="00:00",
+        quarter=1,
+        player="Player",
+        team="TEAM",
+        description="Normal play",
+        importance="medium",
     )
+    for i in range(5)
+)
 
-    highlights = select_highlights(events, None)
+
+def test_end_to_end_critical_event_handling():
+    """Test that critical events are always included."""
+    highlights = select_highlights(list(_CRITICAL_HANDLING_EVENTS), None)
 
     # All 10 critical should be included (exceeds normal max of 8)
-    critical_count = sum(1 for h in highlights if h.event.importance == "critical")
-    assert critical_count == 10
+    importances = [h.event.importance for h in highlights]
+    assert importances.count("critical") == 10
+
+
+# 6 star player events and 6 other player events, built once at import
+_STAR_EVENTS = tuple(
+    GameEvent(
+        id=f"{prefix}{i}",
+        type="play",
+        timestamp="00:00",
+        quarter=i // 2 + 1,
+        player=player,
+        team="TEAM",
+        description=description,
+        importance="high",
+    )
+    for prefix, player, description in (
+        ("star", "StarPlayer", "Star play"),
+        ("other", "OtherPlayer", "Other play"),
+    )
+    for i in range(6)
+)
 
 
 def test_end_to_end_50_percent_rule():
     """Test 50% favorite player rule in realistic scenario."""
     pref = UserPreference(favorite_player="StarPlayer")
 
-    # Create 6 star player events and 6 other player events
-    events = []
-    for i in range(6):
-        events.append(
-            GameEvent(
-                id=f"star{i}",
-                type="play",
-                timestamp="00:00",
-                quarter=i // 2 + 1,
-                player="StarPlayer",
-                team="TEAM",
-                description="Star play",
-                importance="high",
-            )
-        )
-    for i in range(6):
-        events.append(
-            GameEvent(
-                id=f"other{i}",
-                type="play",
-                timestamp="00:00",
-                quarter=i // 2 + 1,
-                player="OtherPlayer",
-                team="TEAM",
-                description="Other play",
-                importance="high",
-            )
-        )
-
-    highlights = select_highlights(events, pref)
+    highlights = select_highlights(list(_STAR_EVENTS), pref)
 
     # Should select 8 total highlights
     assert len(highlights) == 8
 
     # At least 50% should be StarPlayer
-    star_count = sum(1 for h in highlights if h.event.player == "StarPlayer")
-    assert star_count >= 4
+    players = [h.event.player for h in highlights]
+    assert players.count("StarPlayer") >= 4
 
 
 def test_end_to_end_deterministic():
@@ -173,16 +135,11 @@ def test_end_to_end_deterministic():
 
     pref = UserPreference(favorite_player="Player0", favorite_team="TEAM")
 
-    # Run multiple times
-    results = [select_highlights(events, pref) for _ in range(3)]
+    # Run twice; dataclass equality compares every field of every highlight
+    baseline = select_highlights(events, pref)
+    repeat = select_highlights(events, pref)
 
-    # All results should be identical
-    for i in range(1, len(results)):
-        assert len(results[0]) == len(results[i])
-        for j in range(len(results[0])):
-            assert results[0][j].event.id == results[i][j].event.id
-            assert results[0][j].rank == results[i][j].rank
-            assert results[0][j].score == results[i][j].score
+    assert baseline == repeat
 
 
 def test_end_to_end_json_serialization_round_trip():
@@ -1,6 +1,15 @@
 """Unit tests for data models module."""
 
-from highlight_selector.models import GameEvent, UserPreference
+from dataclasses import fields
+
+import pytest
+
+from highlight_selector.models import (
+    GameEvent,
+    Highlight,
+    ScoreBreakdown,
+    UserPreference,
+)
 
 
 def test_game_event_creation_with_all_fields():
@@ -59,8 +68,8 @@ def test_game_event_field_access():
         tags=["highlight_reel"],
     )
 
-    # Verify all fields are accessible
-    fields = [
+    # Verify all fields are declared on the dataclass
+    expected = {
         "id",
         "type",
         "timestamp",
@@ -70,27 +79,24 @@ def test_game_event_field_access():
         "description",
         "importance",
         "tags",
-    ]
-    for field_name in fields:
-        assert hasattr(event, field_name), f"Field '{field_name}' not accessible"
+    }
+    assert expected <= {f.name for f in fields(event)}
 
 
-def test_game_event_importance_values():
+@pytest.mark.parametrize("importance", ["critical", "high", "medium", "low"])
+def test_game_event_importance_values(importance):
     """Verify all valid importance levels work correctly."""
-    importance_levels = ["critical", "high", "medium", "low"]
-
-    for i, importance in enumerate(importance_levels):
-        event = GameEvent(
-            id=f"event_{i}",
-            type="test_play",
-            timestamp="Q1 10:00",
-            quarter=1,
-            player="Test Player",
-            team="Test Team",
-            description="Test description",
-            importance=importance,
-        )
-        assert event.importance == importance
+    event = GameEvent(
+        id=f"event_{importance}",
+        type="test_play",
+        timestamp="Q1 10:00",
+        quarter=1,
+        player="Test Player",
+        team="Test Team",
+        description="Test description",
+        importance=importance,
+    )
+    assert event.importance == importance
 
 
 def test_game_event_empty_tags_explicitly():
@@ -148,36 +154,22 @@ def test_game_event_dataclass_features():
 # UserPreference Tests
 
 
-def test_user_preference_both_fields():
-    """Verify UserPreference with both favorite_player and favorite_team."""
-    pref = UserPreference(favorite_player="LeBron James", favorite_team="Lakers")
-
-    assert pref.favorite_player == "LeBron James"
-    assert pref.favorite_team == "Lakers"
+@pytest.mark.parametrize(
+    "player, team",
+    [
+        ("LeBron James", "Lakers"),
+        ("Stephen Curry", None),
+        (None, "Celtics"),
+        (None, None),
+    ],
+    ids=["both_fields", "player_only", "team_only", "neither_specified"],
+)
+def test_user_preference_fields(player, team):
+    """Verify UserPreference keeps each combination of Optional[str] favorites."""
+    pref = UserPreference(favorite_player=player, favorite_team=team)
 
-
-def test_user_preference_player_only():
-    """Verify UserPreference with only favorite_player specified."""
-    pref = UserPreference(favorite_player="Stephen Curry", favorite_team=None)
-
-    assert pref.favorite_player == "Stephen Curry"
-    assert pref.favorite_team is None
-
-
-def test_user_preference_team_only():
-    """Verify UserPreference with only favorite_team specified."""
-    pref = UserPreference(favorite_player=None, favorite_team="Celtics")
-
-    assert pref.favorite_player is None
-    assert pref.favorite_team == "Celtics"
-
-
-def test_user_preference_neither_specified():
-    """Verify UserPreference with both fields as None."""
-    pref = UserPreference(favorite_player=None, favorite_team=None)
-
-    assert pref.favorite_player is None
-    assert pref.favorite_team is None
+    assert pref.favorite_player == player
+    assert pref.favorite_team == team
 
 
 def test_user_preference_default_none():
@@ -188,27 +180,11 @@ def test_user_preference_default_none():
     assert pref.favorite_team is None
 
 
-def test_user_preference_optional_fields():
-    """Verify Optional[str] type hints allow None values."""
-    # This test verifies type system works correctly (mypy will validate)
-    pref1 = UserPreference(favorite_player="Player", favorite_team="Team")
-    pref2 = UserPreference(favorite_player="Player", favorite_team=None)
-    pref3 = UserPreference(favorite_player=None, favorite_team="Team")
-    pref4 = UserPreference(favorite_player=None, favorite_team=None)
-
-    assert pref1.favorite_player is not None
-    assert pref2.favorite_team is None
-    assert pref3.favorite_player is None
-    assert pref4.favorite_player is None and pref4.favorite_team is None
-
-
 # Story 1.3: ScoreBreakdown Tests
 
 
 def test_score_breakdown_creation_with_all_fields():
     """Verify ScoreBreakdown instantiation with all fields."""
-    from highlight_selector.models import ScoreBreakdown
-
     breakdown = ScoreBreakdown(
         base_score=50,
         player_boost=10,
@@ -225,8 +201,6 @@ def test_score_breakdown_creation_with_all_fields():
 
 def test_score_breakdown_context_boosts_dict():
     """Verify context_boosts is a dictionary."""
-    from highlight_selector.models import ScoreBreakdown
-
     breakdown = ScoreBreakdown(
         base_score=50,
         player_boost=0,
@@ -240,8 +214,6 @@ def test_score_breakdown_context_boosts_dict():
 
 def test_score_breakdown_total_calculation():
     """Verify total_score equals sum of all components."""
-    from highlight_selector.models import ScoreBreakdown
-
     breakdown = ScoreBreakdown(
         base_score=50,
         player_boost=10,
@@ -260,8 +232,6 @@ def test_score_breakdown_total_calculation():
 
 def test_score_breakdown_empty_context_boosts():
     """Verify ScoreBreakdown with empty context_boosts."""
-    from highlight_selector.models import ScoreBreakdown
-
     breakdown = ScoreBreakdown(
         base_score=50,
         player_boost=10,
@@ -275,8 +245,6 @@ def test_score_breakdown_empty_context_boosts():
 
 def test_score_breakdown_numeric_types():
     """Verify ScoreBreakdown accepts both int and float."""
-    from highlight_selector.models import ScoreBreakdown
-
     breakdown = ScoreBreakdown(
         base_score=50.5,
         player_boost=10,
@@ -291,8 +259,6 @@ def test_score_breakdown_numeric_types():
 
 def test_score_breakdown_dataclass_features():
     """Verify ScoreBreakdown dataclass equality."""
-    from highlight_selector.models import ScoreBreakdown
-
     breakdown1 = ScoreBreakdown(
         base_score=50, player_boost=10, team_boost=5, context_boosts={}, total_score=65
     )
@@ -305,132 +271,60 @@ def test_score_breakdown_dataclass_features():
 # Story 1.4: Highlight Tests
 
 
-def test_highlight_creation_with_event_reference():
+def test_highlight_creation_with_event_reference(sample_event):
     """Verify Highlight instantiation with GameEvent reference."""
-    from highlight_selector.models import Highlight
-
-    event = GameEvent(
-        id="evt1",
-        type="touchdown",
-        timestamp="10:23",
-        quarter=3,
-        player="J.Allen",
-        team="BUF",
-        description="15-yard TD pass",
-        importance="critical",
-    )
     highlight = Highlight(
-        event=event, rank=1, score=95.5, explanation="Critical touchdown in Q3."
+        event=sample_event, rank=1, score=95.5, explanation="Critical touchdown in Q3."
     )
-    assert highlight.event == event
+    assert highlight.event == sample_event
     assert highlight.rank == 1
     assert highlight.score == 95.5
     assert highlight.explanation == "Critical touchdown in Q3."
 
 
-def test_highlight_contains_full_game_event():
+def test_highlight_contains_full_game_event(sample_event):
     """Verify Highlight contains full GameEvent object."""
-    from highlight_selector.models import Highlight
-
-    event = GameEvent(
-        id="evt1",
-        type="touchdown",
-        timestamp="10:23",
-        quarter=3,
-        player="J.Allen",
-        team="BUF",
-        description="15-yard TD pass",
-        importance="critical",
-    )
     highlight = Highlight(
-        event=event, rank=1, score=95.5, explanation="Critical touchdown in Q3."
+        event=sample_event, rank=1, score=95.5, explanation="Critical touchdown in Q3."
     )
     assert highlight.event.id == "evt1"
     assert highlight.event.player == "J.Allen"
     assert highlight.event.team == "BUF"
 
 
-def test_highlight_rank_in_range():
+def test_highlight_rank_in_range(sample_event):
     """Verify rank is an integer in range 1-8."""
-    from highlight_selector.models import Highlight
-
-    event = GameEvent(
-        id="evt1",
-        type="touchdown",
-        timestamp="10:23",
-        quarter=3,
-        player="J.Allen",
-        team="BUF",
-        description="15-yard TD pass",
-        importance="critical",
-    )
     highlight = Highlight(
-        event=event, rank=5, score=85.0, explanation="Mid-game touchdown."
+        event=sample_event, rank=5, score=85.0, explanation="Mid-game touchdown."
     )
     assert isinstance(highlight.rank, int)
     assert 1 <= highlight.rank <= 8
 
 
-def test_highlight_score_numeric():
+def test_highlight_score_numeric(sample_event):
     """Verify score is numeric (int or float)."""
-    from highlight_selector.models import Highlight
-
-    event = GameEvent(
-        id="evt1",
-        type="touchdown",
-        timestamp="10:23",
-        quarter=3,
-        player="J.Allen",
-        team="BUF",
-        description="15-yard TD pass",
-        importance="critical",
-    )
     highlight = Highlight(
-        event=event, rank=1, score=95, explanation="Critical touchdown in Q3."
+        event=sample_event, rank=1, score=95, explanation="Critical touchdown in Q3."
     )
     assert isinstance(highlight.score, (int, float))
 
 
-def test_highlight_explanation_non_empty():
+def test_highlight_explanation_non_empty(sample_event):
     """Verify explanation is a non-empty string."""
-    from highlight_selector.models import Highlight
-
-    event = GameEvent(
-        id="evt1",
-        type="touchdown",
-        timestamp="10:23",
-        quarter=3,
-        player="J.Allen",
-        team="BUF",
-        description="15-yard TD pass",
-        importance="critical",
-    )
     highlight = Highlight(
-        event=event, rank=1, score=95.5, explanation="Critical touchdown in Q3."
+        event=sample_event, rank=1, score=95.5, explanation="Critical touchdown in Q3."
     )
     assert isinstance(highlight.explanation, str)
     assert len(highlight.explanation) > 0
 
 
-def test_highlight_dataclass_features():
+def test_highlight_dataclass_features(sample_event):
     """Verify Highlight dataclass equality."""
-    from highlight_selector.models import Highlight
-
-    event = GameEvent(
-        id="evt1",
-        type="touchdown",
-        timestamp="10:23",
-        quarter=3,
-        player="J.Allen",
-        team="BUF",
-        description="15-yard TD pass",
-        importance="critical",
-    )
     highlight1 = Highlight(
-        event=event, rank=1, score=95.5, explanation="Critical touchdown in Q3."
+        event=sample_event, rank=1, score=95.5, explanation="Critical touchdown in Q3."
     )
     highlight2 = Highlight(
-        event=event, rank=1, score=95.5, explanation="Critical touchdown in Q3."
+        event=sample_event, rank=1, score=95.5, explanation="Critical touchdown in Q3."
     )
     assert highlight1 == highlight2
 
@@ -438,26 +332,23 @@ def test_highlight_dataclass_features():
 # Story 1.5: JSON Serialization Tests
 
 
-def test_game_event_to_dict():
+def test_game_event_to_dict(sample_event):
     """Verify GameEvent.to_dict() serialization."""
-    event = GameEvent(
-        id="evt1",
-        type="touchdown",
-        timestamp="10:23",
-        quarter=3,
-        player="J.Allen",
-        team="BUF",
-        description="15-yard TD pass",
-        importance="critical",
-        tags=["offensive"],
-    )
-    result = event.to_dict()
+    result = sample_event.to_dict()
     assert result["id"] == "evt1"
     assert result["player"] == "J.Allen"
     assert result["tags"] == ["offensive"]
     assert isinstance(result, dict)
 
 
+def test_game_event_to_dict_copies_tags(sample_event):
+    """Verify mutating the serialized tags leaves the event untouched."""
+    result = sample_event.to_dict()
+    result["tags"].append("extra")
+
+    assert sample_event.tags == ["offensive"]
+
+
 def test_game_event_from_dict():
     """Verify GameEvent.from_dict() deserialization."""
     data = {
@@ -478,6 +369,35 @@ def test_game_event_from_dict():
     assert isinstance(event, GameEvent)
 
 
+def test_game_event_from_dict_interns_repeated_strings():
+    """Verify parsed events share one object per player, team, type and tag."""
+
+    def build(suffix):
+        # Build strings at runtime so they start out as distinct objects
+        return GameEvent.from_dict(
+            {
+                "id": "evt" + suffix,
+                "type": "".join(["touch", "down"]),
+                "timestamp": "10:23",
+                "quarter": 3,
+                "player": "".join(["J.", "Allen"]),
+                "team": "".join(["BU", "F"]),
+                "description": "TD pass",
+                "importance": "".join(["crit", "ical"]),
+                "tags": ["".join(["offen", "sive"])],
+            }
+        )
+
+    first, second = build("1"), build("2")
+    pref = UserPreference(favorite_player="".join(["J.", "Allen"]))
+
+    assert first.player is second.player is pref.favorite_player
+    assert first.team is second.team
+    assert first.type is second.type
+    assert first.importance is second.importance
+    assert first.tags[0] is second.tags[0]
+
+
 def test_user_preference_to_dict_with_none():
     """Verify UserPreference.to_dict() preserves None values."""
     pref = UserPreference(favorite_player="J.Allen", favorite_team=None)
@@ -497,8 +417,6 @@ def test_user_preference_from_dict():
 
 def test_score_breakdown_to_dict():
     """Verify ScoreBreakdown.to_dict() serialization."""
-    from highlight_selector.models import ScoreBreakdown
-
     breakdown = ScoreBreakdown(
         base_score=50,
         player_boost=10,
@@ -512,10 +430,23 @@ def test_score_breakdown_to_dict():
     assert isinstance(result, dict)
 
 
+def test_score_breakdown_to_dict_copies_context_boosts():
+    """Verify mutating the serialized boosts leaves the breakdown untouched."""
+    breakdown = ScoreBreakdown(
+        base_score=50,
+        player_boost=0,
+        team_boost=0,
+        context_boosts={"clutch": 15},
+        total_score=65,
+    )
+    result = breakdown.to_dict()
+    result["context_boosts"]["game_winner"] = 25
+
+    assert breakdown.context_boosts == {"clutch": 15}
+
+
 def test_score_breakdown_from_dict():
     """Verify ScoreBreakdown.from_dict() deserialization."""
-    from highlight_selector.models import ScoreBreakdown
-
     data = {
         "base_score": 50,
         "player_boost": 10,
@@ -529,22 +460,10 @@ def test_score_breakdown_from_dict():
     assert isinstance(breakdown, ScoreBreakdown)
 
 
-def test_highlight_to_dict_with_nested_event():
+def test_highlight_to_dict_with_nested_event(sample_event):
     """Verify Highlight.to_dict() converts nested GameEvent to dict."""
-    from highlight_selector.models import Highlight
-
-    event = GameEvent(
-        id="evt1",
-        type="touchdown",
-        timestamp="10:23",
-        quarter=3,
-        player="J.Allen",
-        team="BUF",
-        description="15-yard TD pass",
-        importance="critical",
-    )
     highlight = Highlight(
-        event=event, rank=1, score=95.5, explanation="Critical touchdown in Q3."
+        event=sample_event, rank=1, score=95.5, explanation="Critical touchdown in Q3."
     )
     result = highlight.to_dict()
     assert isinstance(result["event"], dict)
@@ -554,8 +473,6 @@ def test_highlight_to_dict_with_nested_event():
 
 def test_highlight_from_dict_with_nested_event():
     """Verify Highlight.from_dict() reconstructs nested GameEvent."""
-    from highlight_selector.models import Highlight
-
     data = {
         "event": {
             "id": "evt1",
@@ -578,43 +495,19 @@ def test_highlight_from_dict_with_nested_event():
     assert highlight.rank == 1
 
 
-def test_round_trip_serialization_game_event():
+def test_round_trip_serialization_game_event(sample_event):
     """Verify GameEvent serialization round-trip preserves data."""
-    event = GameEvent(
-        id="evt1",
-        type="touchdown",
-        timestamp="10:23",
-        quarter=3,
-        player="J.Allen",
-        team="BUF",
-        description="15-yard TD pass",
-        importance="critical",
-        tags=["offensive"],
-    )
-    data = event.to_dict()
+    data = sample_event.to_dict()
     reconstructed = GameEvent.from_dict(data)
-    assert reconstructed == event
+    assert reconstructed == sample_event
 
 
-def test_round_trip_serialization_highlight():
+def test_round_trip_serialization_highlight(sample_event):
     """Verify Highlight serialization round-trip preserves data."""
-    from highlight_selector.models import Highlight
-
-    event = GameEvent(
-        id="evt1",
-        type="touchdown",
-        timestamp="10:23",
-        quarter=3,
-        player="J.Allen",
-        team="BUF",
-        description="15-yard TD pass",
-        importance="critical",
-        tags=["offensive"],
-    )
     highlight = Highlight(
-        event=event, rank=1, score=95.5, explanation="Critical touchdown in Q3."
+        event=sample_event, rank=1, score=95.5, explanation="Critical touchdown in Q3."
     )
     data = highlight.to_dict()
     reconstructed = Highlight.from_dict(data)
     assert reconstructed == highlight
-    assert reconstructed.event == event
+    assert reconstructed.event == sample_event
@@ -1,5 +1,7 @@
 """Unit tests for highlight selection logic."""
 
+import pytest
+
 from highlight_selector.models import GameEvent, UserPreference, Highlight
 from highlight_selector.selector import select_highlights
 
@@ -27,74 +29,59 @@ def make_event(
     )
 
 
-# Story 3.1 & 3.2: Sorting and Tie-Breaking Tests
-
-
-def test_select_highlights_sorts_by_score_descending():
-    """Verify events are sorted by score in descending order."""
-    events = [
-        make_event("evt1", "low"),  # score: 25
-        make_event("evt2", "critical"),  # score: 100
-        make_event("evt3", "medium"),  # score: 50
-    ]
-
-    highlights = select_highlights(events, None)
-
-    assert highlights[0].event.id == "evt2"  # critical (100)
-    assert highlights[1].event.id == "evt3"  # medium (50)
-    assert highlights[2].event.id == "evt1"  # low (25)
-
+@pytest.fixture(scope="module")
+def medium_events():
+    """Twelve equal-score medium events, evt00-evt11, built once per module.
 
-def test_select_highlights_tie_breaking_by_quarter():
-    """Verify tie-breaking uses quarter (descending)."""
-    events = [
-        make_event("evt1", "high", quarter=1),  # 75 pts, Q1
-        make_event("evt2", "high", quarter=4),  # 75 pts, Q4
-        make_event("evt3", "high", quarter=3),  # 75 pts, Q3
-    ]
-
-    highlights = select_highlights(events, None)
+    Returned as a tuple so tests cannot mutate the shared events list; slice
+    and wrap it in list() to get the input for select_highlights.
+    """
+    return tuple(make_event(f"evt{i:02d}", "medium") for i in range(12))
 
-    # Same score, should be ordered Q4 > Q3 > Q1
-    assert highlights[0].event.id == "evt2"  # Q4
-    assert highlights[1].event.id == "evt3"  # Q3
-    assert highlights[2].event.id == "evt1"  # Q1
 
+# Story 3.1 & 3.2: Sorting and Tie-Breaking Tests
 
-def test_select_highlights_tie_breaking_by_importance():
-    """Verify tie-breaking uses importance when quarters equal."""
-    events = [
-        make_event("evt1", "medium", quarter=2),  # Different importance, same quarter
-        make_event("evt2", "critical", quarter=2),
-        make_event("evt3", "high", quarter=2),
-    ]
-    # All have different importance, different base scores, so this tests sorting
-
-    highlights = select_highlights(events, None)
-
-    assert highlights[0].event.id == "evt2"  # critical
-    assert highlights[1].event.id == "evt3"  # high
-    assert highlights[2].event.id == "evt1"  # medium
 
-
-def test_select_highlights_tie_breaking_by_id():
-    """Verify tie-breaking uses ID (ascending) as final tiebreaker."""
-    events = [
-        make_event("evt3", "high", quarter=2),
-        make_event("evt1", "high", quarter=2),
-        make_event("evt2", "high", quarter=2),
-    ]
+@pytest.mark.parametrize(
+    "specs, expected",
+    [
+        # Different base scores: critical (100) > medium (50) > low (25)
+        (
+            [("evt1", "low"), ("evt2", "critical"), ("evt3", "medium")],
+            ["evt2", "evt3", "evt1"],
+        ),
+        # Same score: later quarter first (Q4 > Q3 > Q1)
+        (
+            [("evt1", "high", 1), ("evt2", "high", 4), ("evt3", "high", 3)],
+            ["evt2", "evt3", "evt1"],
+        ),
+        # Same quarter, different importance
+        (
+            [("evt1", "medium", 2), ("evt2", "critical", 2), ("evt3", "high", 2)],
+            ["evt2", "evt3", "evt1"],
+        ),
+        # Same score and quarter: ID ascending as final tiebreaker
+        (
+            [("evt3", "high", 2), ("evt1", "high", 2), ("evt2", "high", 2)],
+            ["evt1", "evt2", "evt3"],
+        ),
+    ],
+    ids=["score_descending", "by_quarter", "by_importance", "by_id"],
+)
+def test_select_highlights_ranking_order(specs, expected):
+    """Verify score ordering and the quarter -> importance -> ID tie-breakers."""
+    events = [make_event(*spec) for spec in specs]
 
     highlights = select_highlights(events, None)
 
-    # Same score, same quarter, should be ordered by ID: evt1 < evt2 < evt3
-    assert highlights[0].event.id == "evt1"
-    assert highlights[1].event.id == "evt2"
-    assert highlights[2].event.id == "evt3"
+    assert [h.event.id for h in highlights] == expected
 
 
 # Story 3.3: Force-Include Critical Events
 
+# Expected IDs, built once at import rather than on every test run
+_CRITICAL_10_IDS = frozenset(f"critical{i}" for i in range(10))
+
 
 def test_select_highlights_includes_all_critical_events():
     """Verify all critical events are included regardless of count."""
@@ -105,9 +92,7 @@ def test_select_highlights_includes_all_critical_events():
 
     # All 10 critical events should be included
     assert len(highlights) == 10
-    critical_ids = {h.event.id for h in highlights}
-    expected_ids = {f"critical{i}" for i in range(10)}
-    assert critical_ids == expected_ids
+    assert {h.event.id for h in highlights} == _CRITICAL_10_IDS
 
 
 def test_select_highlights_critical_events_maintain_ranking():
@@ -128,42 +113,40 @@ def test_select_highlights_critical_events_maintain_ranking():
 # Story 3.4: Select 5-8 Highlights
 
 
-def test_select_highlights_returns_all_when_fewer_than_5():
+def test_select_highlights_returns_all_when_fewer_than_5(medium_events):
     """Verify all events returned when count < 5."""
-    events = [make_event(f"evt{i}", "medium") for i in range(3)]
-
-    highlights = select_highlights(events, None)
+    highlights = select_highlights(list(medium_events[:3]), None)
 
     assert len(highlights) == 3
 
 
-def test_select_highlights_returns_all_when_5_to_8():
+@pytest.mark.parametrize("count", [5, 6, 7, 8])
+def test_select_highlights_returns_all_when_5_to_8(medium_events, count):
     """Verify all events returned when count is 5-8."""
-    for count in [5, 6, 7, 8]:
-        events = [make_event(f"evt{i}", "medium") for i in range(count)]
-        highlights = select_highlights(events, None)
-        assert len(highlights) == count
+    highlights = select_highlights(list(medium_events[:count]), None)
 
+    assert len(highlights) == count
 
-def test_select_highlights_returns_top_8_when_more_than_8():
+
+# Top 8 of the 12 equal-score medium events: tie-break by ID ascending
+_TOP_8_MEDIUM_IDS = [f"evt{i:02d}" for i in range(8)]
+
+
+def test_select_highlights_returns_top_8_when_more_than_8(medium_events):
     """Verify top 8 returned when count > 8 (no critical events)."""
     # 12 medium events, no special rules apply
-    events = [make_event(f"evt{i:02d}", "medium") for i in range(12)]
-
-    highlights = select_highlights(events, None)
+    highlights = select_highlights(list(medium_events), None)
 
     # Should return exactly 8
     assert len(highlights) == 8
     # Should be top 8 by ID (all same score, tie-break by ID)
-    expected_ids = [f"evt{i:02d}" for i in range(8)]
-    actual_ids = [h.event.id for h in highlights]
-    assert actual_ids == expected_ids
+    assert [h.event.id for h in highlights] == _TOP_8_MEDIUM_IDS
 
 
-def test_select_highlights_critical_can_exceed_max():
+def test_select_highlights_critical_can_exceed_max(medium_events):
     """Verify critical events can push count above 8."""
     # 8 medium events + 3 critical events = 11 total
-    events = [make_event(f"med{i}", "medium") for i in range(8)]
+    events = list(medium_events[:8])
     events += [make_event(f"crit{i}", "critical") for i in range(3)]
 
     highlights = select_highlights(events, None)
@@ -187,7 +170,7 @@ def test_select_highlights_50_percent_favorite_player_rule():
 
     # Should select 8 events, at least 4 should be Star
     assert len(highlights) == 8
-    star_count = sum(1 for h in highlights if h.event.player == "Star")
+    star_count = [h.event.player for h in highlights].count("Star")
     assert star_count >= 4  # At least 50%
 
 
@@ -238,7 +221,7 @@ def test_select_highlights_50_percent_respects_score_ranking():
     # Should select 8 events, with at least 4 Star events
     # Star events have score 80 (medium + boost), Others have 75
     # Top 3 should be Star (80), then need 1 more Star to meet 50%
-    star_count = sum(1 for h in highlights if h.event.player == "Star")
+    star_count = [h.event.player for h in highlights].count("Star")
     assert star_count >= 4
 
 
@@ -299,8 +282,31 @@ def test_select_highlights_empty_input():
     assert highlights == []
 
 
-def test_select_highlights_integration_all_rules():
-    """Integration test applying all selection rules together."""
+def _check_critical_included(highlights):
+    critical_ids = {h.event.id for h in highlights if h.event.importance == "critical"}
+    assert "crit1" in critical_ids
+    assert "crit2" in critical_ids
+
+
+def _check_rank_sequential(highlights):
+    assert highlights[0].rank == 1
+    assert highlights[-1].rank == len(highlights)
+
+
+def _check_scores_positive(highlights):
+    assert all(h.score > 0 for h in highlights)
+
+
+@pytest.mark.parametrize(
+    "check",
+    [_check_critical_included, _check_rank_sequential, _check_scores_positive],
+    ids=["critical_included", "rank_sequential", "scores_positive"],
+)
+def test_select_highlights_integration_all_rules(check):
+    """Integration test applying all selection rules together.
+
+    Each invariant is its own case, so a failure names the rule that broke.
+    """
     pref = UserPreference(favorite_player="Star", favorite_team="TEAM")
 
     events = [
@@ -321,17 +327,7 @@ def test_select_highlights_integration_all_rules():
 
     highlights = select_highlights(events, pref)
 
-    # Verify critical events included
-    critical_ids = {h.event.id for h in highlights if h.event.importance == "critical"}
-    assert "crit1" in critical_ids
-    assert "crit2" in critical_ids
-
-    # Verify ranking
-    assert highlights[0].rank == 1
-    assert highlights[-1].rank == len(highlights)
-
-    # Verify all have scores
-    assert all(h.score > 0 for h in highlights)
+    check(highlights)
 
 
 def test_select_highlights_with_custom_limits():
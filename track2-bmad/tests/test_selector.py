@@ -1,5 +1,7 @@
 """Unit tests for selector module scoring functions."""
 
+import pytest
+
 from highlight_selector.models import GameEvent, UserPreference, ScoreBreakdown
 from highlight_selector.selector import (
     calculate_base_score,
@@ -7,14 +9,25 @@ from highlight_selector.selector import (
     calculate_team_boost,
     calculate_context_boosts,
     calculate_score,
+    _total_score,
 )
 
-
 # Story 2.1: Base Importance Scoring Tests
 
 
-def test_calculate_base_score_critical():
-    """Verify critical importance returns 100 points."""
+@pytest.mark.parametrize(
+    "importance, expected",
+    [
+        ("critical", 100),
+        ("high", 75),
+        ("medium", 50),
+        ("low", 25),
+        ("very_high", 25),
+    ],
+    ids=["critical", "high", "medium", "low", "unknown_defaults_to_low"],
+)
+def test_calculate_base_score(importance, expected):
+    """Verify each importance level's base score; unknown levels score as low."""
     event = GameEvent(
         id="evt1",
         type="touchdown",
@@ -22,259 +35,104 @@ def test_calculate_base_score_critical():
         quarter=3,
         player="J.Allen",
         team="BUF",
-        description="Critical TD",
-        importance="critical",
+        description="Scoring play",
+        importance=importance,
     )
-    assert calculate_base_score(event) == 100
+    assert calculate_base_score(event) == expected
 
 
-def test_calculate_base_score_high():
-    """Verify high importance returns 75 points."""
-    event = GameEvent(
-        id="evt2",
-        type="interception",
-        timestamp="08:15",
-        quarter=2,
-        player="S.Gilmore",
-        team="BUF",
-        description="Red zone INT",
-        importance="high",
-    )
-    assert calculate_base_score(event) == 75
-
-
-def test_calculate_base_score_medium():
-    """Verify medium importance returns 50 points."""
-    event = GameEvent(
-        id="evt3",
-        type="first_down",
-        timestamp="12:00",
-        quarter=1,
-        player="D.Henry",
-        team="TEN",
-        description="First down run",
-        importance="medium",
-    )
-    assert calculate_base_score(event) == 50
-
-
-def test_calculate_base_score_low():
-    """Verify low importance returns 25 points."""
-    event = GameEvent(
-        id="evt4",
-        type="tackle",
-        timestamp="05:30",
-        quarter=4,
-        player="T.Watt",
-        team="PIT",
-        description="Solo tackle",
-        importance="low",
-    )
-    assert calculate_base_score(event) == 25
-
-
-def test_calculate_base_score_unknown_defaults_to_low():
-    """Verify unknown importance defaults to low (25 points)."""
-    event = GameEvent(
-        id="evt5",
-        type="penalty",
-        timestamp="03:45",
-        quarter=2,
-        player="Unknown",
-        team="DAL",
-        description="False start",
-        importance="very_high",  # Unknown importance
-    )
-    assert calculate_base_score(event) == 25
-
-
-def test_calculate_base_score_deterministic():
+def test_calculate_base_score_deterministic(sample_event):
     """Verify same input always returns same output."""
-    event = GameEvent(
-        id="evt1",
-        type="touchdown",
-        timestamp="10:23",
-        quarter=3,
-        player="J.Allen",
-        team="BUF",
-        description="Critical TD",
-        importance="critical",
-    )
-    result1 = calculate_base_score(event)
-    result2 = calculate_base_score(event)
+    result1 = calculate_base_score(sample_event)
+    result2 = calculate_base_score(sample_event)
     assert result1 == result2 == 100
 
 
 # Story 2.2: Player Preference Boost Tests
 
 
-def test_calculate_player_boost_match():
-    """Verify +30 boost when player matches favorite."""
-    event = GameEvent(
-        id="evt1",
-        type="touchdown",
-        timestamp="10:23",
-        quarter=3,
-        player="J.Allen",
-        team="BUF",
-        description="TD pass",
-        importance="critical",
-    )
-    pref = UserPreference(favorite_player="J.Allen")
-    assert calculate_player_boost(event, pref) == 30
-
-
-def test_calculate_player_boost_no_match():
-    """Verify 0 boost when player does not match."""
-    event = GameEvent(
-        id="evt1",
-        type="touchdown",
-        timestamp="10:23",
-        quarter=3,
-        player="T.Brady",
-        team="TB",
-        description="TD pass",
-        importance="critical",
-    )
-    pref = UserPreference(favorite_player="J.Allen")
-    assert calculate_player_boost(event, pref) == 0
-
-
-def test_calculate_player_boost_no_favorite_specified():
-    """Verify 0 boost when no favorite player specified."""
-    event = GameEvent(
-        id="evt1",
-        type="touchdown",
-        timestamp="10:23",
-        quarter=3,
-        player="J.Allen",
-        team="BUF",
-        description="TD pass",
-        importance="critical",
-    )
-    pref = UserPreference(favorite_player=None)
-    assert calculate_player_boost(event, pref) == 0
-
-
-def test_calculate_player_boost_case_sensitive():
-    """Verify player name matching is case-sensitive."""
+@pytest.mark.parametrize(
+    "favorite_player, event_player, expected",
+    [
+        ("J.Allen", "J.Allen", 30),
+        ("J.Allen", "T.Brady", 0),
+        (None, "J.Allen", 0),
+        ("j.allen", "J.Allen", 0),
+    ],
+    ids=["match", "no_match", "no_favorite_specified", "case_sensitive"],
+)
+def test_calculate_player_boost(favorite_player, event_player, expected):
+    """Verify +30 only for an exact, case-sensitive favorite player match."""
     event = GameEvent(
         id="evt1",
         type="touchdown",
         timestamp="10:23",
         quarter=3,
-        player="J.Allen",
+        player=event_player,
         team="BUF",
         description="TD pass",
         importance="critical",
     )
-    pref = UserPreference(favorite_player="j.allen")  # lowercase
-    assert calculate_player_boost(event, pref) == 0
+    pref = UserPreference(favorite_player=favorite_player)
+    assert calculate_player_boost(event, pref) == expected
 
 
-def test_calculate_player_boost_handles_none_preference():
+def test_calculate_player_boost_handles_none_preference(sample_event):
     """Verify function handles None preference without error."""
-    event = GameEvent(
-        id="evt1",
-        type="touchdown",
-        timestamp="10:23",
-        quarter=3,
-        player="J.Allen",
-        team="BUF",
-        description="TD pass",
-        importance="critical",
-    )
     # Pass None as preference should not raise error
-    assert calculate_player_boost(event, None) == 0
+    assert calculate_player_boost(sample_event, None) == 0
 
 
 # Story 2.3: Team Preference Boost Tests
 
 
-def test_calculate_team_boost_match():
-    """Verify +15 boost when team matches favorite."""
-    event = GameEvent(
-        id="evt1",
-        type="touchdown",
-        timestamp="10:23",
-        quarter=3,
-        player="J.Allen",
-        team="BUF",
-        description="TD pass",
-        importance="critical",
-    )
-    pref = UserPreference(favorite_team="BUF")
-    assert calculate_team_boost(event, pref) == 15
-
-
-def test_calculate_team_boost_no_match():
-    """Verify 0 boost when team does not match."""
-    event = GameEvent(
-        id="evt1",
-        type="touchdown",
-        timestamp="10:23",
-        quarter=3,
-        player="T.Brady",
-        team="TB",
-        description="TD pass",
-        importance="critical",
-    )
-    pref = UserPreference(favorite_team="NE")
-    assert calculate_team_boost(event, pref) == 0
-
-
-def test_calculate_team_boost_no_favorite_specified():
-    """Verify 0 boost when no favorite team specified."""
-    event = GameEvent(
-        id="evt1",
-        type="touchdown",
-        timestamp="10:23",
-        quarter=3,
-        player="J.Allen",
-        team="BUF",
-        description="TD pass",
-        importance="critical",
-    )
-    pref = UserPreference(favorite_team=None)
-    assert calculate_team_boost(event, pref) == 0
-
-
-def test_calculate_team_boost_case_sensitive():
-    """Verify team name matching is case-sensitive."""
+@pytest.mark.parametrize(
+    "favorite_team, event_team, expected",
+    [
+        ("BUF", "BUF", 15),
+        ("NE", "TB", 0),
+        (None, "BUF", 0),
+        ("buf", "BUF", 0),
+    ],
+    ids=["match", "no_match", "no_favorite_specified", "case_sensitive"],
+)
+def test_calculate_team_boost(favorite_team, event_team, expected):
+    """Verify +15 only for an exact, case-sensitive favorite team match."""
     event = GameEvent(
         id="evt1",
         type="touchdown",
         timestamp="10:23",
         quarter=3,
         player="J.Allen",
-        team="BUF",
+        team=event_team,
         description="TD pass",
         importance="critical",
     )
-    pref = UserPreference(favorite_team="buf")  # lowercase
-    assert calculate_team_boost(event, pref) == 0
+    pref = UserPreference(favorite_team=favorite_team)
+    assert calculate_team_boost(event, pref) == expected
 
 
-def test_calculate_team_boost_handles_none_preference():
+def test_calculate_team_boost_handles_none_preference(sample_event):
     """Verify function handles None preference without error."""
-    event = GameEvent(
-        id="evt1",
-        type="touchdown",
-        timestamp="10:23",
-        quarter=3,
-        player="J.Allen",
-        team="BUF",
-        description="TD pass",
-        importance="critical",
-    )
-    assert calculate_team_boost(event, None) == 0
+    assert calculate_team_boost(sample_event, None) == 0
 
 
 # Story 2.4: Context Tag Boosts Tests
 
 
-def test_calculate_context_boosts_clutch():
-    """Verify clutch tag adds +20 points."""
+@pytest.mark.parametrize(
+    "tag, expected",
+    [
+        ("clutch", 20),
+        ("game_winner", 25),
+        ("buzzer_beater", 15),
+        ("highlight_reel", 15),
+        ("fourth_quarter", 10),
+    ],
+    ids=lambda value: value if isinstance(value, str) else None,
+)
+def test_calculate_context_boosts_single_tag(tag, expected):
+    """Verify each recognized tag contributes its own boost."""
     event = GameEvent(
         id="evt1",
         type="touchdown",
@@ -282,80 +140,11 @@ def test_calculate_context_boosts_clutch():
         quarter=4,
         player="J.Allen",
         team="BUF",
-        description="Game-tying TD",
-        importance="critical",
-        tags=["clutch"],
-    )
-    boosts = calculate_context_boosts(event)
-    assert boosts == {"clutch": 20}
-
-
-def test_calculate_context_boosts_game_winner():
-    """Verify game_winner tag adds +25 points."""
-    event = GameEvent(
-        id="evt2",
-        type="field_goal",
-        timestamp="00:01",
-        quarter=4,
-        player="T.Bass",
-        team="BUF",
-        description="Game-winning FG",
+        description="Tagged play",
         importance="critical",
-        tags=["game_winner"],
-    )
-    boosts = calculate_context_boosts(event)
-    assert boosts == {"game_winner": 25}
-
-
-def test_calculate_context_boosts_buzzer_beater():
-    """Verify buzzer_beater tag adds +15 points."""
-    event = GameEvent(
-        id="evt3",
-        type="field_goal",
-        timestamp="00:00",
-        quarter=2,
-        player="T.Bass",
-        team="BUF",
-        description="Half-ending FG",
-        importance="high",
-        tags=["buzzer_beater"],
-    )
-    boosts = calculate_context_boosts(event)
-    assert boosts == {"buzzer_beater": 15}
-
-
-def test_calculate_context_boosts_highlight_reel():
-    """Verify highlight_reel tag adds +15 points."""
-    event = GameEvent(
-        id="evt4",
-        type="catch",
-        timestamp="08:30",
-        quarter=3,
-        player="D.Adams",
-        team="GB",
-        description="One-handed catch",
-        importance="high",
-        tags=["highlight_reel"],
-    )
-    boosts = calculate_context_boosts(event)
-    assert boosts == {"highlight_reel": 15}
-
-
-def test_calculate_context_boosts_fourth_quarter():
-    """Verify fourth_quarter tag adds +10 points."""
-    event = GameEvent(
-        id="evt5",
-        type="interception",
-        timestamp="03:15",
-        quarter=4,
-        player="T.White",
-        team="BUF",
-        description="Late INT",
-        importance="high",
-        tags=["fourth_quarter"],
+        tags=[tag],
     )
-    boosts = calculate_context_boosts(event)
-    assert boosts == {"fourth_quarter": 10}
+    assert calculate_context_boosts(event) == {tag: expected}
 
 
 def test_calculate_context_boosts_multiple_tags():
@@ -506,21 +295,11 @@ def test_calculate_score_no_boosts():
     assert breakdown.total_score == 25  # 25 + 0 + 0 + 0
 
 
-def test_calculate_score_returns_score_breakdown():
+def test_calculate_score_returns_score_breakdown(sample_event):
     """Verify function returns ScoreBreakdown instance."""
-    event = GameEvent(
-        id="evt1",
-        type="touchdown",
-        timestamp="10:23",
-        quarter=3,
-        player="J.Allen",
-        team="BUF",
-        description="TD",
-        importance="critical",
-    )
     pref = UserPreference(favorite_player="J.Allen")
 
-    breakdown = calculate_score(event, pref)
+    breakdown = calculate_score(sample_event, pref)
 
     assert isinstance(breakdown, ScoreBreakdown)
 
@@ -549,3 +328,42 @@ def test_calculate_score_total_matches_sum():
         + sum(breakdown.context_boosts.values())
     )
     assert breakdown.total_score == expected_total
+
+
+@pytest.mark.parametrize(
+    "tags",
+    [
+        [],
+        ["clutch", "game_winner"],
+        ["clutch", "clutch"],
+        ["unknown_tag", "defensive"],
+        ["clutch", "unknown_tag", "clutch", "fourth_quarter"],
+    ],
+    ids=["no_tags", "known_tags", "duplicate_tags", "unknown_tags", "mixed"],
+)
+@pytest.mark.parametrize(
+    "pref",
+    [
+        None,
+        UserPreference(),
+        UserPreference(favorite_player="J.Allen"),
+        UserPreference(favorite_team="BUF"),
+        UserPreference(favorite_player="J.Allen", favorite_team="BUF"),
+    ],
+    ids=["none", "empty", "player", "team", "player_and_team"],
+)
+def test_total_score_matches_calculate_score(tags, pref):
+    """Verify the ranking score always equals the displayed breakdown total."""
+    event = GameEvent(
+        id="evt1",
+        type="touchdown",
+        timestamp="01:30",
+        quarter=4,
+        player="J.Allen",
+        team="BUF",
+        description="TD pass",
+        importance="high",
+        tags=tags,
+    )
+
+    assert _total_score(event, pref) == calculate_score(event, pref).total_score